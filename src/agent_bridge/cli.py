@@ -42,6 +42,7 @@ def _main():
     # --- update ---
     p_update = sub.add_parser("update", help="Sync vaults and refresh configs")
     p_update.add_argument("--target", default=".agent", help="Target directory")
+    p_update.add_argument("--quiet", "-q", action="store_true", help="Suppress progress output")
 
     # --- clean ---
     p_clean = sub.add_parser("clean", help="Remove generated IDE configs")
@@ -106,6 +107,7 @@ def _main():
         p = sub.add_parser(name, help=f"Convert to {name}")
         p.add_argument("--source", default=".agent")
         p.add_argument("--output", default="")
+        p.add_argument("--verbose", "-v", action="store_true", help="Print per-file progress")
 
     args = parser.parse_args()
 
@@ -143,7 +145,6 @@ def _get_selected_formats(args, registry) -> list:
 
 def _handle_init(args, registry):
     from agent_bridge.services.init_service import run_init
-    from agent_bridge.tui import run_init_tui
 
     project_path = Path.cwd()
     agent_dir = project_path / getattr(args, "source", ".agent")
@@ -156,6 +157,8 @@ def _handle_init(args, registry):
     from_snapshot = getattr(args, "from_snapshot", None)
 
     if use_tui and not from_snapshot:
+        from agent_bridge.tui import run_init_tui
+
         print(f"{Colors.HEADER}Initializing AI for current project...{Colors.ENDC}")
         print(f"\n{Colors.CYAN}Agent Bridge - Interactive Setup{Colors.ENDC}\n")
         success = run_init_tui(registry, project_path, agent_dir)
@@ -192,7 +195,6 @@ def _handle_init(args, registry):
 
 def _handle_capture(args):
     from agent_bridge.services.capture_service import execute_capture, scan_for_captures
-    from agent_bridge.tui import run_capture_tui
 
     project_path = Path.cwd()
     has_flags = getattr(args, "cursor", False) or getattr(args, "kiro", False) or getattr(args, "copilot", False) or getattr(args, "all", False)
@@ -213,6 +215,8 @@ def _handle_capture(args):
     strategy = getattr(args, "strategy", "ask")
 
     if not has_flags or strategy == "ask":
+        from agent_bridge.tui import run_capture_tui
+
         success = run_capture_tui(project_path, files, strategy, dry_run)
         if success:
             print(f"\n{Colors.GREEN}Capture complete!{Colors.ENDC}")
@@ -299,7 +303,7 @@ def _handle_update(args):
     from agent_bridge.services.sync_service import run_update
 
     target = Path(getattr(args, "target", ".agent"))
-    run_update(target)
+    run_update(target, verbose=not args.quiet)
 
 
 def _handle_clean(args, registry):
@@ -421,7 +425,8 @@ def _handle_direct_convert(args, registry):
     name = args.format
     conv = registry.get(name)
     if conv:
-        result = conv.convert(source, Path.cwd(), verbose=True)
+        # Per-file progress chi khi --verbose: hang tram print() chiem phan lon thoi gian tren console cham
+        result = conv.convert(source, Path.cwd(), verbose=getattr(args, "verbose", False))
         conv.install_mcp(source, Path.cwd())
         if result.ok:
             print(f"{Colors.GREEN}{name} conversion complete!{Colors.ENDC}")
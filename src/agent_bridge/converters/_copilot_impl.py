@@ -4,6 +4,7 @@ Implementation logic cho GitHub Copilot converter.
 Tach rieng de converters/copilot.py chi chua BaseConverter wrapper.
 """
 
+import os
 import re
 import shutil
 from pathlib import Path
@@ -483,12 +484,18 @@ def apply_reverse_capture_copilot(
         dest_skill_dir = agent_dir / "skills" / skill_dir.name
         dest_skill_dir.mkdir(parents=True, exist_ok=True)
         (dest_skill_dir / "SKILL.md").write_text(body, encoding="utf-8")
-        for item in skill_dir.iterdir():
-            if item.name != "SKILL.md":
-                if item.is_file():
-                    shutil.copy2(item, dest_skill_dir / item.name)
-                elif item.is_dir():
-                    shutil.copytree(item, dest_skill_dir / item.name, dirs_exist_ok=True)
+        # shutil.copy: contents via sendfile (in-kernel) and keeps the mode (.sh scripts);
+        # skips copy2's copystat (utime/xattr) since IDE-side mtimes need not survive
+        with os.scandir(skill_dir) as it:
+            for entry in it:
+                if entry.name == "SKILL.md":
+                    continue
+                if entry.is_file():
+                    shutil.copy(entry.path, dest_skill_dir / entry.name)
+                elif entry.is_dir():
+                    shutil.copytree(
+                        entry.path, dest_skill_dir / entry.name, copy_function=shutil.copy, dirs_exist_ok=True
+                    )
         return True
 
     if github_root / "prompts" in ide_path.parents or ide_path.parent == github_root / "prompts":
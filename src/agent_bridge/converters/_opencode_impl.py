@@ -471,9 +471,9 @@ def convert_to_opencode(source_root: Path, dest_root: Path, verbose: bool = True
 
 def copy_mcp_opencode(root_path: Path, force: bool = False) -> bool:
     """Tich hop MCP config vao opencode.json."""
-    from agent_bridge.utils import get_master_agent_dir, load_mcp_config
+    from agent_bridge.utils import dir_children, load_mcp_config, master_agent_dir_status
 
-    source_root = root_path if (root_path / ".agent").exists() else get_master_agent_dir().parent
+    source_root = root_path if ".agent" in dir_children(root_path) else master_agent_dir_status()[0].parent
     mcp_config = load_mcp_config(source_root)
 
     if mcp_config:
@@ -12,10 +12,31 @@ Reference: https://docs.windsurf.com/windsurf/cascade/memories
 Activation modes: Manual, Always On, Model Decision, Glob
 """
 
+import io
+import os
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+_RE_FRONTMATTER = re.compile(r"^---\n.*?\n---\n*", re.DOTALL)
+_RE_H1 = re.compile(r"^#\s+.+\n*")
+_RE_STEP = re.compile(r"^\d+\.\s+(.+)$", re.MULTILINE)
+_RE_STEP_HEADER = re.compile(r"^##\s+(?:Step\s+\d+[:\s]*)?(.+)$", re.MULTILINE)
+_RE_DESCRIPTION = re.compile(r"^>\s*(.+?)$|^(?:Description|Purpose)[:\s]*(.+?)(?:\n|$)", re.MULTILINE | re.IGNORECASE)
+
+# Rules are capped at 12000 chars, so reading more than a few multiples of that
+# from a source file only builds strings that get sliced away. The slack covers
+# frontmatter and leading whitespace that are stripped before the cap applies.
+_READ_WINDOW_CHARS = 4 * 12000
+
+
+def _read_text_capped(path, limit: int = _READ_WINDOW_CHARS) -> str:
+    """Read at most ``limit`` characters of a UTF-8 text file."""
+    with open(path, encoding="utf-8") as f:
+        return f.read(limit)
+
 
 # =============================================================================
 # WINDSURF RULE CONFIGURATION
@@ -142,28 +163,29 @@ def generate_windsurf_rule_header(name: str, mode: str, description: str, globs:
 
     ---
     """
-    lines = [f"# {name}", ""]
+    buf = io.StringIO()
+    buf.write(f"# {name}\n\n")
 
     # Activation mode
     if mode == "always":
-        lines.append("**Activation:** Always On")
+        buf.write("**Activation:** Always On\n")
     elif mode == "glob" and globs:
         glob_str = ", ".join(globs[:5])  # Limit displayed globs
         if len(globs) > 5:
             glob_str += f" (+{len(globs) - 5} more)"
-        lines.append(f"**Activation:** Glob: `{glob_str}`")
+        buf.write(f"**Activation:** Glob: `{glob_str}`\n")
     elif mode == "model":
-        lines.append("**Activation:** Model Decision")
+        buf.write("**Activation:** Model Decision\n")
     else:
-        lines.append("**Activation:** Manual (@mention)")
+        buf.write("**Activation:** Manual (@mention)\n")
 
     # Description
     if description:
-        lines.append(f"**Description:** {description}")
+        buf.write(f"**Description:** {description}\n")
 
-    lines.extend(["", "---", ""])
+    buf.write("\n---\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def generate_workflow_content(name: str, steps: List[str], description: str = "") -> str:
@@ -172,28 +194,19 @@ def generate_workflow_content(name: str, steps: List[str], description: str = ""
 
     Workflows are invoked via /workflow-name command.
     """
-    lines = [
-        f"# {name}",
-        "",
-        f"**Description:** {description}" if description else "",
-        "",
-        "## Steps",
-        "",
-    ]
+    buf = io.StringIO()
+    buf.write(f"# {name}\n\n")
+    if description:
+        buf.write(f"**Description:** {description}")
+    buf.write("\n\n## Steps\n\n")
 
     for i, step in enumerate(steps, 1):
-        lines.append(f"{i}. {step}")
+        buf.write(f"{i}. {step}\n")
 
-    lines.extend(
-        [
-            "",
-            "---",
-            "",
-            "*Invoke this workflow with* `/{}` *in Cascade.*".format(name.lower().replace(" ", "-")),
-        ]
-    )
+    buf.write("\n---\n\n")
+    buf.write("*Invoke this workflow with* `/{}` *in Cascade.*".format(name.lower().replace(" ", "-")))
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 # =============================================================================
@@ -201,21 +214,67 @@ def generate_workflow_content(name: str, steps: List[str], description: str = ""
 # =============================================================================
 
 
-def convert_skill_to_windsurf_rule(source_dir: Path, dest_path: Path) -> bool:
+def _write_output(dest_path: Union[str, Path], data: Union[str, bytes]) -> None:
+    """
+    Write converter output, creating the parent directory. Accepts plain str paths.
+
+    str data is written with newline="" so it gets the same LF bytes as the bytes path on every OS.
+    """
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    if isinstance(data, bytes):
+        with open(dest_path, "wb") as f:
+            f.write(data)
+    else:
+        with open(dest_path, "w", encoding="utf-8", newline="") as f:
+            f.write(data)
+
+
+def _rule_bytes_fast_path(raw: bytes, header: bytes, max_chars: int) -> Optional[bytes]:
+    """
+    Return ``header + raw.strip() + b"\\n"`` when that is byte-identical to the
+    str-based conversion, else None.
+
+    Requires: no frontmatter, no CR (text mode would translate newlines), valid
+    UTF-8, stripped edges that bytes.strip() and str.strip() agree on, and a byte
+    length (an upper bound on the char length) that cannot hit the truncation limit.
+    """
+    if raw.startswith(b"---\n") or b"\r" in raw:
+        return None
+    body = raw.strip()
+    if len(header) + len(body) + 1 > max_chars:
+        return None
+    # str.strip() also removes \x1c-\x1f and non-ASCII whitespace (e.g. NBSP)
+    if body and not (0x1F < body[0] < 0x80 and 0x1F < body[-1] < 0x80):
+        return None
+    if not raw.isascii():
+        try:
+            raw.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+    return header + body + b"\n"
+
+
+def convert_skill_to_windsurf_rule(source_dir: Path, dest_path: Union[str, Path]) -> bool:
     """Convert skill to Windsurf rule with activation mode."""
     try:
         skill_name = source_dir.name
 
+        # One scandir pass serves both the SKILL.md lookup and the merge below
+        with os.scandir(source_dir) as it:
+            md_entries = sorted(
+                (e for e in it if e.name.endswith(".md")),
+                key=lambda e: e.name,
+            )
+
         # Find SKILL.md
-        skill_file = source_dir / "SKILL.md"
-        if not skill_file.exists():
-            md_files = list(source_dir.glob("*.md"))
-            skill_file = md_files[0] if md_files else None
+        skill_file = next((e for e in md_entries if e.name == "SKILL.md"), None)
+        if skill_file is None:
+            skill_file = md_entries[0] if md_entries else None
 
         if not skill_file:
             return False
 
-        content = skill_file.read_text(encoding="utf-8")
+        content = _read_text_capped(skill_file.path)
 
         # Get activation config
         config = SKILL_ACTIVATION_MAP.get(
@@ -228,8 +287,8 @@ def convert_skill_to_windsurf_rule(source_dir: Path, dest_path: Path) -> bool:
         )
 
         # Remove existing frontmatter/header
-        content_clean = re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL)
-        content_clean = re.sub(r"^#\s+.+\n*", "", content_clean)  # Remove first H1
+        content_clean = _RE_FRONTMATTER.sub("", content)
+        content_clean = _RE_H1.sub("", content_clean, count=1)  # Remove first H1
 
         # Generate header with activation mode
         header = generate_windsurf_rule_header(
@@ -240,10 +299,12 @@ def convert_skill_to_windsurf_rule(source_dir: Path, dest_path: Path) -> bool:
         )
 
         # Merge additional .md files
-        for md_file in sorted(source_dir.glob("*.md")):
+        for md_file in md_entries:
+            if len(content_clean) >= _READ_WINDOW_CHARS:
+                break  # Already past the rule limit; remaining files would be truncated away
             if md_file.name != "SKILL.md":
-                additional = md_file.read_text(encoding="utf-8")
-                additional_clean = re.sub(r"^---\n.*?\n---\n*", "", additional, flags=re.DOTALL)
+                additional = _read_text_capped(md_file.path)
+                additional_clean = _RE_FRONTMATTER.sub("", additional)
                 content_clean += f"\n\n---\n\n{additional_clean}"
 
         # Windsurf has a per-rule character limit
@@ -255,24 +316,22 @@ def convert_skill_to_windsurf_rule(source_dir: Path, dest_path: Path) -> bool:
         if len(output) > WINDSURF_RULE_MAX_CHARS:
             output = output[: WINDSURF_RULE_MAX_CHARS - len(WINDSURF_TRUNCATE_SUFFIX)] + WINDSURF_TRUNCATE_SUFFIX
 
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        dest_path.write_text(output, encoding="utf-8")
+        _write_output(dest_path, output)
         return True
     except Exception as e:
         print(f"  Error converting skill {source_dir.name}: {e}")
         return False
 
 
-def convert_agent_to_windsurf_rule(source_path: Path, dest_path: Path) -> bool:
+def convert_agent_to_windsurf_rule(source_path: Path, dest_path: Union[str, Path]) -> bool:
     """Convert agent to Windsurf rule."""
     try:
-        content = source_path.read_text(encoding="utf-8")
+        with open(source_path, "rb") as f:
+            raw = f.read(_READ_WINDOW_CHARS)
+        complete = len(raw) < _READ_WINDOW_CHARS
         agent_slug = source_path.stem.lower()
         agent_name = agent_slug.replace("-", " ").title()
 
-        # Remove existing frontmatter
-        content_clean = re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL)
-
         # Generate header
         header = generate_windsurf_rule_header(
             name=agent_name,
@@ -284,44 +343,52 @@ def convert_agent_to_windsurf_rule(source_path: Path, dest_path: Path) -> bool:
         WINDSURF_RULE_MAX_CHARS = 12000
         WINDSURF_TRUNCATE_SUFFIX = "\n\n... (truncated to fit Windsurf rule limit)\n"
 
+        # Fast path: no frontmatter and no truncation possible -> splice bytes
+        # without the decode/regex/encode round trip.
+        fast = _rule_bytes_fast_path(raw, header.encode("utf-8"), WINDSURF_RULE_MAX_CHARS) if complete else None
+        if fast is not None:
+            _write_output(dest_path, fast)
+            return True
+
+        if complete:
+            # Match read_text()'s universal-newline translation
+            content = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        else:
+            content = _read_text_capped(source_path)
+
+        # Remove existing frontmatter
+        content_clean = _RE_FRONTMATTER.sub("", content)
+
         output = f"{header}{content_clean.strip()}\n"
         if len(output) > WINDSURF_RULE_MAX_CHARS:
             output = output[: WINDSURF_RULE_MAX_CHARS - len(WINDSURF_TRUNCATE_SUFFIX)] + WINDSURF_TRUNCATE_SUFFIX
 
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        dest_path.write_text(output, encoding="utf-8")
+        _write_output(dest_path, output)
         return True
     except Exception as e:
         print(f"  Error converting agent {source_path.name}: {e}")
         return False
 
 
-def convert_workflow_to_windsurf(source_path: Path, dest_path: Path) -> bool:
+def convert_workflow_to_windsurf(source_path: Path, dest_path: Union[str, Path]) -> bool:
     """Convert workflow to Windsurf workflow format."""
     try:
         content = source_path.read_text(encoding="utf-8")
         workflow_name = source_path.stem.replace("-", " ").title()
 
-        # Extract steps from markdown
-        steps = []
-        step_matches = re.findall(r"^\d+\.\s+(.+)$", content, re.MULTILINE)
-        if step_matches:
-            steps = step_matches
-        else:
-            # Extract from headers
-            header_matches = re.findall(r"^##\s+(?:Step\s+\d+[:\s]*)?(.+)$", content, re.MULTILINE)
-            steps = header_matches if header_matches else ["Follow the instructions below"]
+        # Extract steps from markdown; headers are only scanned when there are no numbered steps.
+        # Two independent scans: a combined alternation lets "##\s+" run across a newline and
+        # swallow the following numbered step, since findall matches cannot overlap.
+        steps = _RE_STEP.findall(content) or _RE_STEP_HEADER.findall(content) or ["Follow the instructions below"]
 
         # Extract description
-        desc_match = re.search(
-            r"^>\s*(.+?)$|^(?:Description|Purpose)[:\s]*(.+?)(?:\n|$)", content, re.MULTILINE | re.IGNORECASE
-        )
+        desc_match = _RE_DESCRIPTION.search(content)
         description = ""
         if desc_match:
             description = (desc_match.group(1) or desc_match.group(2) or "").strip()
 
         # Remove existing frontmatter
-        content_clean = re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL)
+        content_clean = _RE_FRONTMATTER.sub("", content)
 
         # Build workflow output
         output = generate_workflow_content(workflow_name, steps, description)
@@ -332,8 +399,7 @@ def convert_workflow_to_windsurf(source_path: Path, dest_path: Path) -> bool:
         if len(output) > WINDSURF_RULE_MAX_CHARS:
             output = output[: WINDSURF_RULE_MAX_CHARS - len(WINDSURF_TRUNCATE_SUFFIX)] + WINDSURF_TRUNCATE_SUFFIX
 
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        dest_path.write_text(output, encoding="utf-8")
+        _write_output(dest_path, output)
         return True
     except Exception as e:
         print(f"  Error converting workflow {source_path.name}: {e}")
@@ -353,7 +419,7 @@ def create_windsurfrules(dest_root: Path, source_root: Path) -> bool:
                 if skill_file.exists():
                     content = skill_file.read_text(encoding="utf-8")
                     # Strip frontmatter
-                    content = re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL)
+                    content = _RE_FRONTMATTER.sub("", content)
                     parts.append(content.strip())
                     parts.append("")
 
@@ -361,8 +427,8 @@ def create_windsurfrules(dest_root: Path, source_root: Path) -> bool:
         for candidate in ["AGENTS.md", ".agent/ARCHITECTURE.md"]:
             candidate_path = source_root / candidate
             if candidate_path.exists():
-                content = candidate_path.read_text(encoding="utf-8")
-                parts.append(content[:3000].strip())
+                content = _read_text_capped(candidate_path, 3000)
+                parts.append(content.strip())
                 parts.append("")
                 break
 
@@ -378,6 +444,17 @@ def create_windsurfrules(dest_root: Path, source_root: Path) -> bool:
         return False
 
 
+# (convert fn, source path, dest path, label for error messages)
+_ConversionTask = Tuple[Callable[[Path, Union[str, Path]], bool], Path, str, str]
+
+
+def _run_conversions(pool: ThreadPoolExecutor, tasks: Sequence[_ConversionTask]) -> List[bool]:
+    """Run (fn, src, dest, label) tasks on ``pool`` and return results in task order."""
+    if len(tasks) <= 1:
+        return [fn(src, dest) for fn, src, dest, _label in tasks]
+    return list(pool.map(lambda t: t[0](t[1], t[2]), tasks))
+
+
 def convert_to_windsurf(source_root: Path, dest_root: Path, verbose: bool = True) -> Dict[str, Any]:
     """
     Main conversion function for Windsurf format.
@@ -396,51 +473,57 @@ def convert_to_windsurf(source_root: Path, dest_root: Path, verbose: bool = True
     skills_src = source_root / ".agent" / "skills"
     workflows_src = source_root / ".agent" / "workflows"
 
-    rules_dest = dest_root / ".windsurf" / "rules"
-    workflows_dest = dest_root / ".windsurf" / "workflows"
+    # Plain str joins in the per-file loops; Path.__truediv__ is noticeably slower in bulk
+    rules_dest = os.path.join(dest_root, ".windsurf", "rules")
+    workflows_dest = os.path.join(dest_root, ".windsurf", "workflows")
 
-    # Convert agents to rules
+    # Files within a group convert in parallel; groups stay sequential because an
+    # agent and a skill with the same name both target rules/<name>.md (skill wins).
+    groups: List[Tuple[str, str, str, List[_ConversionTask]]] = []
     if agents_src.exists():
-        if verbose:
-            print("Converting agents to Windsurf rules...")
-
-        for agent_file in agents_src.glob("*.md"):
-            dest_file = rules_dest / agent_file.name
-            if convert_agent_to_windsurf_rule(agent_file, dest_file):
-                stats["rules"] += 1
-                if verbose:
-                    print(f"  ✓ {agent_file.name}")
-            else:
-                stats["errors"].append(f"rule:{agent_file.name}")
-
-    # Convert skills to rules
+        groups.append((
+            "Converting agents to Windsurf rules...",
+            "rules",
+            "rule",
+            [
+                (convert_agent_to_windsurf_rule, f, os.path.join(rules_dest, f.name), f.name)
+                for f in agents_src.glob("*.md")
+            ],
+        ))
     if skills_src.exists():
-        if verbose:
-            print("Converting skills to Windsurf rules...")
-
-        for skill_dir in skills_src.iterdir():
-            if skill_dir.is_dir():
-                dest_file = rules_dest / f"{skill_dir.name}.md"
-                if convert_skill_to_windsurf_rule(skill_dir, dest_file):
-                    stats["rules"] += 1
+        groups.append((
+            "Converting skills to Windsurf rules...",
+            "rules",
+            "rule",
+            [
+                (convert_skill_to_windsurf_rule, d, os.path.join(rules_dest, f"{d.name}.md"), d.name)
+                for d in skills_src.iterdir()
+                if d.is_dir()
+            ],
+        ))
+    if workflows_src.exists():
+        groups.append((
+            "Converting workflows to Windsurf format...",
+            "workflows",
+            "workflow",
+            [
+                (convert_workflow_to_windsurf, f, os.path.join(workflows_dest, f.name), f.name)
+                for f in workflows_src.glob("*.md")
+            ],
+        ))
+
+    # One pool shared by every group
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for message, stat_key, error_prefix, tasks in groups:
+            if verbose:
+                print(message)
+            for (_fn, _src, dest_file, label), ok in zip(tasks, _run_conversions(pool, tasks)):
+                if ok:
+                    stats[stat_key] += 1
                     if verbose:
-                        print(f"  ✓ {skill_dir.name}.md")
+                        print(f"  ✓ {os.path.basename(dest_file)}")
                 else:
-                    stats["errors"].append(f"rule:{skill_dir.name}")
-
-    # Convert workflows
-    if workflows_src.exists():
-        if verbose:
-            print("Converting workflows to Windsurf format...")
-
-        for workflow_file in workflows_src.glob("*.md"):
-            dest_file = workflows_dest / workflow_file.name
-            if convert_workflow_to_windsurf(workflow_file, dest_file):
-                stats["workflows"] += 1
-                if verbose:
-                    print(f"  ✓ {workflow_file.name}")
-            else:
-                stats["errors"].append(f"workflow:{workflow_file.name}")
+                    stats["errors"].append(f"{error_prefix}:{label}")
 
     # Create legacy .windsurfrules
     if create_windsurfrules(dest_root, source_root):
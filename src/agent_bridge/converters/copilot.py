@@ -5,7 +5,6 @@ Output: .github/agents/*.md, .github/skills/<skill>/SKILL.md,
 .github/prompts/*.prompt.md, .github/instructions/*.instructions.md
 """
 
-import shutil
 from pathlib import Path
 from typing import List
 
@@ -23,6 +22,7 @@ from agent_bridge.converters._copilot_impl import (
     generate_copilot_frontmatter,
     reverse_convert_copilot,
 )
+from agent_bridge.utils import dir_children, fast_rmtree
 
 
 class CopilotConverter(BaseConverter):
@@ -63,10 +63,11 @@ class CopilotConverter(BaseConverter):
         return install_mcp_for_ide(source_root, dest_root, "copilot")
 
     def clean(self, project_path: Path) -> bool:
+        github_dir = project_path / ".github"
+        present = dir_children(github_dir)
         for sub in ["agents", "skills", "prompts", "instructions"]:
-            p = project_path / ".github" / sub
-            if p.exists():
-                shutil.rmtree(p)
+            if sub in present:
+                fast_rmtree(github_dir / sub)
         return True
 
     def reverse_convert(
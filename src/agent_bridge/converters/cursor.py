@@ -2,13 +2,13 @@
 Cursor AI converter — chuyen doi .agent/ sang dang .cursor/agents, rules, skills.
 """
 
-import shutil
 from pathlib import Path
 from typing import List
 
 from agent_bridge.core.converter import BaseConverter, converter_registry
 from agent_bridge.core.types import CapturedFile, ConversionResult, IDEFormat
 from agent_bridge.converters._cursor_impl import convert_to_cursor, reverse_convert_cursor
+from agent_bridge.utils import dir_children, fast_rmtree
 
 
 class CursorConverter(BaseConverter):
@@ -49,10 +49,11 @@ class CursorConverter(BaseConverter):
         return install_mcp_for_ide(source_root, dest_root, "cursor")
 
     def clean(self, project_path: Path) -> bool:
+        cursor_dir = project_path / ".cursor"
+        present = dir_children(cursor_dir)
         for sub in ["agents", "rules", "skills"]:
-            p = project_path / ".cursor" / sub
-            if p.exists():
-                shutil.rmtree(p)
+            if sub in present:
+                fast_rmtree(cursor_dir / sub)
         return True
 
     def reverse_convert(
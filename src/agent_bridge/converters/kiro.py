@@ -2,13 +2,13 @@
 Kiro CLI converter — chuyen doi .agent/ sang dang .kiro/agents, skills, prompts, steering.
 """
 
-import shutil
 from pathlib import Path
 from typing import List
 
 from agent_bridge.core.converter import BaseConverter, converter_registry
 from agent_bridge.core.types import CapturedFile, ConversionResult, IDEFormat
 from agent_bridge.converters._kiro_impl import convert_to_kiro, reverse_convert_kiro
+from agent_bridge.utils import dir_children, fast_rmtree
 
 
 class KiroConverter(BaseConverter):
@@ -48,15 +48,11 @@ class KiroConverter(BaseConverter):
         return install_mcp_for_ide(source_root, dest_root, "kiro")
 
     def clean(self, project_path: Path) -> bool:
-        paths = [
-            project_path / ".kiro" / "agents",
-            project_path / ".kiro" / "skills",
-            project_path / ".kiro" / "steering",
-            project_path / ".kiro" / "prompts",
-        ]
-        for p in paths:
-            if p.exists():
-                shutil.rmtree(p)
+        kiro_dir = project_path / ".kiro"
+        present = dir_children(kiro_dir)
+        for sub in ["agents", "skills", "steering", "prompts"]:
+            if sub in present:
+                fast_rmtree(kiro_dir / sub)
         return True
 
     def reverse_convert(
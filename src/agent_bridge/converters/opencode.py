@@ -2,12 +2,12 @@
 OpenCode converter — chuyen doi .agent/ sang dang .opencode/agents, commands, skills.
 """
 
-import shutil
 from pathlib import Path
 
 from agent_bridge.core.converter import BaseConverter, converter_registry
 from agent_bridge.core.types import ConversionResult, IDEFormat
 from agent_bridge.converters._opencode_impl import convert_to_opencode, copy_mcp_opencode
+from agent_bridge.utils import dir_children, fast_rmtree
 
 
 class OpenCodeConverter(BaseConverter):
@@ -44,13 +44,13 @@ class OpenCodeConverter(BaseConverter):
         return copy_mcp_opencode(dest_root, force)
 
     def clean(self, project_path: Path) -> bool:
+        opencode_dir = project_path / ".opencode"
+        present = dir_children(opencode_dir)
         for sub in ["agents", "commands", "skills"]:
-            p = project_path / ".opencode" / sub
-            if p.exists():
-                shutil.rmtree(p)
-        config_file = project_path / ".opencode" / "opencode.json"
-        if config_file.exists():
-            config_file.unlink()
+            if sub in present:
+                fast_rmtree(opencode_dir / sub)
+        if "opencode.json" in present:
+            (opencode_dir / "opencode.json").unlink()
         return True
 
 
@@ -2,12 +2,12 @@
 Windsurf converter — chuyen doi .agent/ sang dang .windsurf/rules, workflows.
 """
 
-import shutil
 from pathlib import Path
 
 from agent_bridge.core.converter import BaseConverter, converter_registry
 from agent_bridge.core.types import ConversionResult, IDEFormat
 from agent_bridge.converters._windsurf_impl import convert_to_windsurf
+from agent_bridge.utils import dir_children, fast_rmtree
 
 
 class WindsurfConverter(BaseConverter):
@@ -47,13 +47,17 @@ class WindsurfConverter(BaseConverter):
         return install_mcp_for_ide(source_root, dest_root, "windsurf")
 
     def clean(self, project_path: Path) -> bool:
+        # Mot lan scandir .windsurf/ cho moi subdir thay vi thu xoa tung path;
+        # .windsurfrules chi can 1 unlink (bo qua neu khong ton tai)
+        windsurf_dir = project_path / ".windsurf"
+        present = dir_children(windsurf_dir)
         for sub in ["rules", "workflows"]:
-            p = project_path / ".windsurf" / sub
-            if p.exists():
-                shutil.rmtree(p)
-        legacy = project_path / ".windsurfrules"
-        if legacy.exists():
-            legacy.unlink()
+            if sub in present:
+                fast_rmtree(windsurf_dir / sub)
+        try:
+            (project_path / ".windsurfrules").unlink()
+        except FileNotFoundError:
+            pass
         return True
 
 
@@ -18,14 +18,23 @@ Usage in converters:
 """
 
 import json
+import os
 import shutil
 import subprocess
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..utils import Colors
 
+orjson: Optional[ModuleType]
+try:
+    import orjson  # optional: parse plugins.json straight from bytes
+except ImportError:
+    orjson = None
+
 
 # =============================================================================
 # DATA STRUCTURES
@@ -106,7 +115,8 @@ def load_plugins(source_root: Path) -> List[Plugin]:
         return []
 
     try:
-        data = json.loads(plugins_file.read_text(encoding="utf-8"))
+        raw = plugins_file.read_bytes()
+        data = orjson.loads(raw) if orjson else json.loads(raw)
         plugins_list = data.get("plugins", [])
         return [Plugin.from_dict(p) for p in plugins_list if p.get("name")]
     except (json.JSONDecodeError, TypeError, KeyError) as e:
@@ -114,6 +124,26 @@ def load_plugins(source_root: Path) -> List[Plugin]:
         return []
 
 
+def _load_plugins_cached(source_root: Path) -> List[Plugin]:
+    """
+    load_plugins() memoized per plugins.json (path, mtime_ns, size).
+
+    Each converter builds its own PluginRunner, so one init/update run would
+    otherwise re-read and re-parse the same file once per IDE.
+    """
+    plugins_file = source_root / ".agent" / "plugins.json"
+    try:
+        st = plugins_file.stat()
+    except OSError:
+        return []
+    return list(_load_plugins_keyed(str(plugins_file), st.st_mtime_ns, st.st_size, source_root))
+
+
+@lru_cache(maxsize=16)
+def _load_plugins_keyed(_path: str, _mtime_ns: int, _size: int, source_root: Path) -> Tuple[Plugin, ...]:
+    return tuple(load_plugins(source_root))
+
+
 # =============================================================================
 # CONDITION CHECKER
 # =============================================================================
@@ -127,8 +157,8 @@ def check_condition(plugin: Plugin, source_root: Path) -> bool:
         return True
 
     if cond.file_exists:
-        target_path = source_root / cond.file_exists
-        return target_path.exists()
+        # os.path: no PosixPath allocation per check; "/" separators work on Windows too
+        return os.path.exists(os.path.join(source_root, cond.file_exists))
 
     # No condition specified = always install
     return True
@@ -159,11 +189,13 @@ _INSTALL_TEMPLATES = {
 }
 
 
+@lru_cache(maxsize=64)
 def _check_tool_available(tool_name: str) -> bool:
-    """Check if a CLI tool is available on PATH."""
+    """Check if a CLI tool is available on PATH (cached; cleared after an install)."""
     return shutil.which(tool_name) is not None
 
 
+@lru_cache(maxsize=16)
 def _check_package_manager_available(pm: str) -> bool:
     """Check if the required package manager is available."""
     return shutil.which(pm) is not None
@@ -215,6 +247,7 @@ def _install_prerequisite(plugin: Plugin, verbose: bool = True) -> bool:
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
         if result.returncode == 0:
+            _check_tool_available.cache_clear()  # a newly installed tool is now on PATH
             if verbose:
                 print(f"    {Colors.GREEN}✓ {install.package} installed{Colors.ENDC}")
             return True
@@ -253,7 +286,12 @@ class PluginRunner:
             source_root: Path containing .agent/ with plugins.json
         """
         self.source_root = source_root
-        self.plugins = load_plugins(source_root)
+        self.plugins = _load_plugins_cached(source_root)
+        # ide_name -> plugins with a command for that IDE (load order preserved)
+        self._by_ide: Dict[str, List[Plugin]] = {}
+        for plugin in self.plugins:
+            for ide in plugin.install.commands:
+                self._by_ide.setdefault(ide, []).append(plugin)
 
     def run_for_ide(
         self,
@@ -279,10 +317,7 @@ class PluginRunner:
         if not self.plugins:
             return results
 
-        applicable = [
-            p for p in self.plugins
-            if ide_name in p.install.commands and check_condition(p, self.source_root)
-        ]
+        applicable = [p for p in self._by_ide.get(ide_name, ()) if check_condition(p, self.source_root)]
 
         if not applicable:
             return results
@@ -360,9 +395,9 @@ class PluginRunner:
 
     def list_plugins(self, ide_name: str = None) -> List[Dict[str, Any]]:
         """List plugins, optionally filtered by IDE support."""
-        result = []
-        for p in self.plugins:
-            info = {
+        plugins = self.plugins if ide_name is None else self._by_ide.get(ide_name, ())
+        return [
+            {
                 "name": p.name,
                 "description": p.description,
                 "homepage": p.homepage,
@@ -370,9 +405,8 @@ class PluginRunner:
                 "requires": p.install.requires,
                 "package": p.install.package,
             }
-            if ide_name is None or ide_name in p.install.commands:
-                result.append(info)
-        return result
+            for p in plugins
+        ]
 
 
 # =============================================================================
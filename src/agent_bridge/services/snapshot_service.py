@@ -6,21 +6,106 @@ Snapshot luu tai ~/.config/agent-bridge/snapshots/<name>/
   - .agent/: full copy of .agent/ directory
 """
 
+import errno
+import functools
+import hashlib
 import json
+import os
 import re
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import ModuleType
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from agent_bridge.core.types import SnapshotInfo
+from agent_bridge.utils import HAS_FWALK, fast_copy_file, fast_rmtree
 from agent_bridge.vault.manager import VAULTS_CONFIG_DIR
 
+orjson: Optional[ModuleType]
+try:
+    import orjson  # optional: parse/serialize manifest nhanh hon stdlib json
+except ImportError:
+    orjson = None
+
 SNAPSHOTS_DIR = VAULTS_CONFIG_DIR / "snapshots"
 
 # Subdirectories trong .agent/ de build manifest contents
 AGENT_SUBDIRS = ["agents", "skills", "workflows", "rules"]
 
+# ioctl FICLONE (Linux): reflink copy-on-write tren Btrfs/XFS, khong copy data
+_FICLONE = 0x40049409 if sys.platform.startswith("linux") else None
+_reflink_supported = _FICLONE is not None
+
+
+def _clone_file(src: str, dst: str) -> str:
+    """
+    copy_function cho copytree: reflink (COW) neu FS ho tro, fallback
+    utils.fast_copy_file (copy_file_range, roi copyfileobj).
+
+    Khong dung os.link: hardlink chia se inode nen sua file trong project
+    se sua luon snapshot. Reflink tach block khi ghi nen an toan.
+    """
+    global _reflink_supported
+    if _reflink_supported and _FICLONE is not None:
+        try:
+            import fcntl
+
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except (ImportError, OSError) as e:
+            # FS khong ho tro reflink -> tat cho cac lan sau
+            if isinstance(e, ImportError) or e.errno in (errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL):
+                _reflink_supported = False
+    fast_copy_file(src, dst)
+    return dst
+
+
+# So thread copy file song song (I/O-bound, syscall nha GIL)
+_COPY_WORKERS = 8
+
+
+def _copy_tree(src: Path, dst: Path) -> None:
+    """
+    Nhu shutil.copytree(src, dst, copy_function=_clone_file) nhung copy file song song.
+
+    Tao toan bo cay thu muc truoc (tuan tu), roi copy file bang thread pool;
+    copystat thu muc sau cung de mtime khong bi ghi file lam thay doi.
+    Giong copytree mac dinh: symlink duoc follow (copy noi dung).
+    """
+    dirs: List[Tuple[str, str]] = []
+    files: List[Tuple[str, str]] = []
+    # Goc co the chua co parent (nhu copytree); thu muc con chi can mot mkdir
+    os.makedirs(dst)
+    stack = [(os.fspath(src), os.fspath(dst))]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        if dirs:
+            os.mkdir(dst_dir)
+        dirs.append((src_dir, dst_dir))
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    stack.append((entry.path, target))
+                else:
+                    files.append((entry.path, target))
+
+    if len(files) > 1:
+        with ThreadPoolExecutor(max_workers=min(_COPY_WORKERS, len(files))) as pool:
+            # list(): dua exception tu worker len caller
+            list(pool.map(lambda pair: _clone_file(*pair), files))
+    else:
+        for src_file, dst_file in files:
+            _clone_file(src_file, dst_file)
+
+    for src_dir, dst_dir in reversed(dirs):
+        shutil.copystat(src_dir, dst_dir)
+
 
 def _collect_contents(agent_dir: Path) -> Dict[str, List[str]]:
     """
@@ -46,17 +131,63 @@ def _collect_contents(agent_dir: Path) -> Dict[str, List[str]]:
     return contents
 
 
+def _iter_file_stats(agent_dir: Path) -> Iterator[Tuple[str, str, os.stat_result]]:
+    """
+    Yield (thu muc tuong doi, ten file, stat) theo thu tu on dinh.
+
+    Follow symlink thu muc giong _copy_tree, de fingerprint phu het noi dung duoc copy.
+    """
+    if HAS_FWALK:
+        # fwalk: stat theo dir_fd, kernel khong phai resolve lai ca duong dan
+        for root, dirs, files, root_fd in os.fwalk(agent_dir, follow_symlinks=True):
+            dirs.sort()
+            rel_root = os.path.relpath(root, agent_dir)
+            for fname in sorted(files):
+                try:
+                    yield rel_root, fname, os.stat(fname, dir_fd=root_fd)
+                except OSError:
+                    continue
+        return
+    for root, dirs, files in os.walk(agent_dir, followlinks=True):
+        dirs.sort()
+        rel_root = os.path.relpath(root, agent_dir)
+        for fname in sorted(files):
+            try:
+                yield rel_root, fname, os.stat(os.path.join(root, fname))
+            except OSError:
+                continue
+
+
+def _fingerprint(agent_dir: Path) -> str:
+    """
+    Hash (path tuong doi, size, mtime_ns) cua moi file trong .agent/.
+
+    Dung de phat hien snapshot khong doi ma khong can doc noi dung file.
+    """
+    digest = hashlib.sha1()
+    for rel_root, fname, st in _iter_file_stats(agent_dir):
+        digest.update(f"{rel_root}/{fname}\0{st.st_size}\0{st.st_mtime_ns}\n".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
 def _load_manifest(snapshot_path: Path) -> Optional[Dict[str, Any]]:
-    """Doc manifest.json. Tra ve None neu loi."""
-    manifest_file = snapshot_path / "manifest.json"
-    if not manifest_file.exists():
-        return None
+    """Doc manifest.json. Tra ve None neu khong ton tai hoac loi."""
     try:
-        return json.loads(manifest_file.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
+        raw = (snapshot_path / "manifest.json").read_bytes()
+        return orjson.loads(raw) if orjson else json.loads(raw)
+    except (ValueError, OSError):
         return None
 
 
+def _write_manifest(snapshot_path: Path, manifest: Dict[str, Any]) -> None:
+    """Ghi manifest.json (indent 2, giu nguyen ky tu non-ASCII)."""
+    if orjson:
+        data = orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(manifest, indent=2, ensure_ascii=False).encode("utf-8")
+    (snapshot_path / "manifest.json").write_bytes(data)
+
+
 def save_snapshot(
     name: str,
     agent_dir: Path,
@@ -67,6 +198,8 @@ def save_snapshot(
     Copy .agent/ vao snapshots dir voi manifest.
 
     Neu ten da ton tai: tang version, update timestamp, replace content.
+    Neu noi dung .agent/, description va tags khong doi: chi update timestamp
+    (khong copy lai, khong tang version).
 
     Args:
         name: Ten snapshot (slug, unique)
@@ -83,8 +216,34 @@ def save_snapshot(
     now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
     contents = _collect_contents(agent_dir)
+    fingerprint = _fingerprint(agent_dir)
+    source_project = str(agent_dir.parent)
 
     existing = _load_manifest(snapshot_path)
+    if (
+        existing
+        and existing.get("fingerprint") == fingerprint
+        and existing.get("contents") == contents
+        and existing.get("tags") == tags
+        and existing.get("description") == description
+        and existing.get("source", {}).get("project") == source_project
+        and (snapshot_path / ".agent").is_dir()
+    ):
+        # Khong doi gi: chi cap nhat timestamp, khong copy lai, khong tang version
+        existing["updated"] = now
+        _write_manifest(snapshot_path, existing)
+        list_snapshots_cached.cache_clear()
+        return SnapshotInfo(
+            name=existing.get("name", normalized_name),
+            description=description,
+            created=existing.get("created", now),
+            updated=now,
+            version=existing.get("version", 1),
+            contents=contents,
+            path=snapshot_path,
+            tags=tags,
+        )
+
     if existing:
         version = existing.get("version", 1) + 1
         created = existing.get("created", now)
@@ -93,10 +252,10 @@ def save_snapshot(
         created = now
 
     if snapshot_path.exists():
-        shutil.rmtree(snapshot_path, ignore_errors=True)
+        fast_rmtree(snapshot_path, ignore_errors=True)
     snapshot_path.mkdir(parents=True, exist_ok=True)
     agent_dest = snapshot_path / ".agent"
-    shutil.copytree(agent_dir, agent_dest)
+    _copy_tree(agent_dir, agent_dest)
 
     manifest = {
         "name": normalized_name,
@@ -105,15 +264,15 @@ def save_snapshot(
         "updated": now,
         "version": version,
         "source": {
-            "project": str(agent_dir.parent),
+            "project": source_project,
             "ides_captured_from": [],
         },
         "contents": contents,
         "tags": tags,
+        "fingerprint": fingerprint,
     }
-    (snapshot_path / "manifest.json").write_text(
-        json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+    _write_manifest(snapshot_path, manifest)
+    list_snapshots_cached.cache_clear()
 
     return SnapshotInfo(
         name=normalized_name,
@@ -127,9 +286,21 @@ def save_snapshot(
     )
 
 
+_NAME_ALLOWED = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_-")
+# Bang translate ASCII: ky tu hop le giu nguyen, con lai -> "-"
+_NAME_TABLE = str.maketrans({chr(c): (chr(c) if chr(c) in _NAME_ALLOWED else "-") for c in range(128)})
+_RE_NAME_UNSAFE = re.compile(r"[^a-z0-9_-]")
+
+
+@functools.lru_cache(maxsize=256)
 def _normalize_snapshot_name(name: str) -> str:
     """Chuan hoa ten snapshot: lowercase, thay khoang trang/filename unsafe bang hyphen."""
-    return re.sub(r"[^a-z0-9_-]", "-", name.lower().strip()).strip("-") or "unnamed"
+    lowered = name.lower().strip()
+    if lowered.isascii():
+        cleaned = lowered.translate(_NAME_TABLE)
+    else:
+        cleaned = _RE_NAME_UNSAFE.sub("-", lowered)
+    return cleaned.strip("-") or "unnamed"
 
 
 def list_snapshots() -> List[SnapshotInfo]:
@@ -151,6 +322,16 @@ def list_snapshots() -> List[SnapshotInfo]:
     return result
 
 
+@functools.lru_cache(maxsize=1)
+def list_snapshots_cached() -> Tuple[SnapshotInfo, ...]:
+    """
+    Nhu list_snapshots() nhung cache ket qua (dung cho TUI, tranh scan lai moi lan chon).
+
+    save_snapshot/delete_snapshot tu dong invalidate cache.
+    """
+    return tuple(list_snapshots())
+
+
 def get_snapshot(name: str) -> Optional[SnapshotInfo]:
     """
     Lay thong tin snapshot theo ten.
@@ -186,7 +367,8 @@ def delete_snapshot(name: str) -> bool:
     snapshot_path = SNAPSHOTS_DIR / normalized
     if not snapshot_path.exists():
         return False
-    shutil.rmtree(snapshot_path)
+    fast_rmtree(snapshot_path)
+    list_snapshots_cached.cache_clear()
     return True
 
 
@@ -223,6 +405,6 @@ def restore_snapshot(agent_dir: Path, name: str) -> bool:
     if not snapshot_agent:
         return False
     if agent_dir.exists():
-        shutil.rmtree(agent_dir)
-    shutil.copytree(snapshot_agent, agent_dir)
+        fast_rmtree(agent_dir)
+    _copy_tree(snapshot_agent, agent_dir)
     return True
@@ -6,11 +6,12 @@ Xu ly: 1) Sync tat ca vault
        3) Tu dong refresh IDE config da phat hien
 """
 
-import shutil
+import os
 from pathlib import Path
+from typing import Dict, List, Optional, Set
 
 from agent_bridge.core.converter import converter_registry
-from agent_bridge.utils import Colors, get_master_agent_dir
+from agent_bridge.utils import Colors, fast_copy_file, master_agent_dir_status
 from agent_bridge.vault import VaultManager
 from agent_bridge.vault.merger import MergeStrategy, merge_source_into_project
 
@@ -42,33 +43,32 @@ def run_update(target_dir: Path, verbose: bool = True) -> None:
         return
 
     # Buoc 2: Merge vao project
-    target_path = Path(target_dir).resolve()
-    if not target_path.exists() and not (Path.cwd() / ".git").exists():
+    # Khong resolve(): merge/copy chi can duong dan hop le, khong can tuyet doi
+    target_path = Path(target_dir)
+    if not target_path.exists() and not os.path.exists(".git"):
         # Khong co project, cap nhat master cache
-        master_path = get_master_agent_dir()
-        target_path = master_path if master_path.exists() else Path.cwd() / ".agent"
+        master_path, master_exists = master_agent_dir_status()
+        target_path = master_path if master_exists else Path(".agent")
 
-    target_path.mkdir(parents=True, exist_ok=True)
+    target_path.mkdir(parents=True, exist_ok=True)  # idempotent
     if verbose:
         print(f"{Colors.BLUE}  Merging vaults into {target_path}...{Colors.ENDC}")
 
     vm.merge_to_project(target_path, verbose=verbose)
 
-    # Buoc 3: Copy config files
-    for vault in vm.enabled_vaults:
-        source_root = vm.get_vault_agent_dir(vault)
-        if not source_root:
-            continue
+    # Buoc 3: Copy config files tu vault uu tien cao nhat co noi dung
+    vault = next((v for v in vm.enabled_vaults if vm.get_vault_agent_dir(v)), None)
+    source_root = vm.get_vault_agent_dir(vault) if vault is not None else None
+    if vault is not None and source_root is not None:
         for config_file in ["mcp_config.json"]:
             src_conf = source_root / config_file
             dst_conf = target_path / config_file
             if src_conf.exists() and not dst_conf.exists():
-                shutil.copy2(src_conf, dst_conf)
+                fast_copy_file(src_conf, dst_conf)
                 if verbose:
                     print(f"{Colors.GREEN}    Init {config_file} from {vault.name}.{Colors.ENDC}")
             elif src_conf.exists() and verbose:
                 print(f"{Colors.YELLOW}    Kept local {config_file}.{Colors.ENDC}")
-        break
 
     if verbose:
         print(f"{Colors.GREEN}Knowledge vaults are now up to date!{Colors.ENDC}")
@@ -77,11 +77,60 @@ def run_update(target_dir: Path, verbose: bool = True) -> None:
     _refresh_detected_ides(Path.cwd(), verbose)
 
 
+def _list_names(path: Path) -> Set[str]:
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
+def _present_output_dirs(project: Path, output_dirs: List[str], top_level: Optional[Set[str]] = None) -> Set[str]:
+    """
+    Tra ve cac output_dir ton tai trong project.
+
+    Mot scandir cho project (bo qua neu top_level da co), them mot scandir cho
+    moi thu muc cap 1 chi khi co output_dir long 2 cap (vd: .vscode/settings).
+    Sau hon thi stat truc tiep.
+    """
+    if top_level is None:
+        top_level = _list_names(project)
+    second_level: Dict[str, Set[str]] = {}
+    present: Set[str] = set()
+    for out in output_dirs:
+        parts = Path(out).parts if out else ()
+        if not parts or parts[0] not in top_level:
+            continue
+        if len(parts) == 1:
+            present.add(out)
+            continue
+        if parts[0] not in second_level:
+            second_level[parts[0]] = _list_names(project / parts[0])
+        if parts[1] not in second_level[parts[0]]:
+            continue
+        if len(parts) == 2 or (project / out).exists():
+            present.add(out)
+    return present
+
+
 def _refresh_detected_ides(project: Path, verbose: bool) -> None:
-    """Refresh IDE config da phat hien trong project."""
-    for converter in converter_registry.all():
-        output_dir = project / converter.format_info.output_dir
-        if output_dir.exists():
-            if verbose:
-                print(f"  Auto-refreshing {converter.display_name}...")
-            converter.convert(project, project, verbose=verbose, force=True)
+    """
+    Refresh IDE config da phat hien trong project.
+
+    Chay tuan tu: convert() con chay plugin (hoi user, npm/pip install) nen
+    khong the chay song song giua cac converter.
+    """
+    top_level = _list_names(project)
+    # Chi giu converter co thu muc cap 1 ton tai, theo thu tu registry
+    candidates = [
+        c
+        for c in converter_registry.all()
+        if c.format_info.output_dir and Path(c.format_info.output_dir).parts[0] in top_level
+    ]
+    present = _present_output_dirs(project, [c.format_info.output_dir for c in candidates], top_level)
+    for converter in candidates:
+        if converter.format_info.output_dir not in present:
+            continue
+        if verbose:
+            print(f"  Auto-refreshing {converter.display_name}...")
+        converter.convert(project, project, verbose=verbose, force=True)
@@ -4,26 +4,31 @@ TUI interactive cho agent-bridge init.
 Chuyen tat ca prompt questionary tu cli.py vao day.
 """
 
+from functools import lru_cache
 from pathlib import Path
 
-import questionary
-from questionary import Separator, Style
-
 from agent_bridge.utils import Colors
 
-# Cau hinh style cho Questionary
-CUSTOM_STYLE = Style(
-    [
-        ("qmark", "fg:#00d4ff bold"),
-        ("question", "bold"),
-        ("answer", "fg:#00d4ff bold"),
-        ("pointer", "fg:#00d4ff bold"),
-        ("highlighted", "fg:#00d4ff bold bg:default"),
-        ("selected", "fg:#00d4ff bold bg:default"),
-        ("checkbox", "fg:#888888"),
-        ("checkbox-selected", "fg:#00d4ff bold"),
-    ]
-)
+# questionary keo theo prompt_toolkit (nang) -> chi import khi TUI thuc su chay
+
+
+@lru_cache(maxsize=1)
+def _get_style():
+    """Cau hinh style cho Questionary (tao lan dau goi, cache lai)."""
+    from questionary import Style
+
+    return Style(
+        [
+            ("qmark", "fg:#00d4ff bold"),
+            ("question", "bold"),
+            ("answer", "fg:#00d4ff bold"),
+            ("pointer", "fg:#00d4ff bold"),
+            ("highlighted", "fg:#00d4ff bold bg:default"),
+            ("selected", "fg:#00d4ff bold bg:default"),
+            ("checkbox", "fg:#888888"),
+            ("checkbox-selected", "fg:#00d4ff bold"),
+        ]
+    )
 
 
 def run_init_tui(registry, project_path: Path, agent_dir: Path) -> bool:
@@ -33,8 +38,13 @@ def run_init_tui(registry, project_path: Path, agent_dir: Path) -> bool:
     Returns:
         True neu thanh cong, False neu huy
     """
+    import questionary
+    from questionary import Separator
+
     from agent_bridge.services.init_service import run_init
 
+    style = _get_style()
+
     # 1. Chon nguon
     has_local_agent = agent_dir.exists()
     if has_local_agent:
@@ -48,7 +58,7 @@ def run_init_tui(registry, project_path: Path, agent_dir: Path) -> bool:
                 Separator(),
                 questionary.Choice("Add your own vault first...", value="add_vault"),
             ],
-            style=CUSTOM_STYLE,
+            style=style,
         ).ask()
     else:
         source_choice = questionary.select(
@@ -58,7 +68,7 @@ def run_init_tui(registry, project_path: Path, agent_dir: Path) -> bool:
                 questionary.Choice("From saved snapshot...", value="snapshot"),
                 questionary.Choice("Add your own vault...", value="add_vault"),
             ],
-            style=CUSTOM_STYLE,
+            style=style,
         ).ask()
 
     if not source_choice:
@@ -67,9 +77,9 @@ def run_init_tui(registry, project_path: Path, agent_dir: Path) -> bool:
 
     snapshot_name = None
     if source_choice == "snapshot":
-        from agent_bridge.services.snapshot_service import list_snapshots
+        from agent_bridge.services.snapshot_service import list_snapshots_cached
 
-        snapshots = list_snapshots()
+        snapshots = list_snapshots_cached()
         if not snapshots:
             print(f"{Colors.YELLOW}No snapshots found. Run 'agent-bridge snapshot save <name>' first.{Colors.ENDC}")
             return False
@@ -77,7 +87,7 @@ def run_init_tui(registry, project_path: Path, agent_dir: Path) -> bool:
             questionary.Choice(f"{s.name} (v{s.version}) - {s.description or ''}", value=s.name)
             for s in snapshots
         ]
-        snapshot_name = questionary.select("Select snapshot:", choices=choices, style=CUSTOM_STYLE).ask()
+        snapshot_name = questionary.select("Select snapshot:", choices=choices, style=style).ask()
         if not snapshot_name:
             return False
 
@@ -94,21 +104,21 @@ def run_init_tui(registry, project_path: Path, agent_dir: Path) -> bool:
         if not vm.enabled_vaults:
             print(f"\n  {Colors.YELLOW}No vaults registered yet.{Colors.ENDC}")
             add_vault = questionary.confirm(
-                "Add a vault source now?", default=True, style=CUSTOM_STYLE
+                "Add a vault source now?", default=True, style=style
             ).ask()
 
             if add_vault:
                 vault_url = questionary.text(
                     "Git URL or local path:",
                     default="https://github.com/vudovn/antigravity-kit",
-                    style=CUSTOM_STYLE,
+                    style=style,
                 ).ask()
 
                 if vault_url:
                     vault_name = questionary.text(
                         "Vault name:",
                         default=vault_url.rstrip("/").split("/")[-1].replace(".git", ""),
-                        style=CUSTOM_STYLE,
+                        style=style,
                     ).ask()
 
                     if vault_name:
@@ -130,7 +140,7 @@ def run_init_tui(registry, project_path: Path, agent_dir: Path) -> bool:
     format_choices = questionary.checkbox(
         "Select target IDE formats:",
         choices=choices,
-        style=CUSTOM_STYLE,
+        style=style,
         instruction="Space=toggle, Enter=confirm",
     ).ask()
 
@@ -146,7 +156,7 @@ def run_init_tui(registry, project_path: Path, agent_dir: Path) -> bool:
         print(f"  Snapshot: {Colors.CYAN}{snapshot_name}{Colors.ENDC}")
     print(f"  Target:  {Colors.CYAN}{', '.join(selected_names)}{Colors.ENDC}")
 
-    confirm = questionary.confirm("Proceed?", default=True, style=CUSTOM_STYLE).ask()
+    confirm = questionary.confirm("Proceed?", default=True, style=style).ask()
 
     if not confirm:
         print(f"{Colors.YELLOW}Cancelled.{Colors.ENDC}")
@@ -176,11 +186,15 @@ def run_capture_tui(
     Returns:
         True neu thanh cong
     """
+    import questionary
+
     from agent_bridge.services.capture_service import execute_capture
 
     if not files:
         return False
 
+    style = _get_style()
+
     choices = []
     for cf in files:
         status_str = f"[{cf.status}]" if cf.status else ""
@@ -190,7 +204,7 @@ def run_capture_tui(
     selected = questionary.checkbox(
         "Select files to capture:",
         choices=choices,
-        style=CUSTOM_STYLE,
+        style=style,
         instruction="Space=toggle, Enter=confirm",
     ).ask()
 
@@ -208,14 +222,18 @@ def run_capture_tui(
 
 def _tui_add_vault(has_local_agent: bool) -> str | None:
     """TUI flow them vault custom. Tra ve source_choice hoac None neu huy."""
+    import questionary
+
     from agent_bridge.vault import VaultManager
 
+    style = _get_style()
+
     print(f"\n{Colors.CYAN}  Add a Knowledge Vault{Colors.ENDC}\n")
 
     vault_url = questionary.text(
         "Git URL or local path:",
         instruction="(e.g. https://github.com/yourorg/ai-agents or /path/to/local)",
-        style=CUSTOM_STYLE,
+        style=style,
     ).ask()
 
     if not vault_url:
@@ -226,7 +244,7 @@ def _tui_add_vault(has_local_agent: bool) -> str | None:
     vault_name = questionary.text(
         "Vault name (unique ID):",
         default=default_name,
-        style=CUSTOM_STYLE,
+        style=style,
     ).ask()
 
     if not vault_name:
@@ -234,14 +252,14 @@ def _tui_add_vault(has_local_agent: bool) -> str | None:
         return None
 
     vault_desc = (
-        questionary.text("Description (optional):", default="", style=CUSTOM_STYLE).ask()
+        questionary.text("Description (optional):", default="", style=style).ask()
         or ""
     )
 
     vault_priority = questionary.text(
         "Priority (lower = higher, default 100):",
         default="100",
-        style=CUSTOM_STYLE,
+        style=style,
     ).ask()
     try:
         priority = int(vault_priority)
@@ -274,6 +292,6 @@ def _tui_add_vault(has_local_agent: bool) -> str | None:
                 questionary.Choice("Replace project agents with vault", value="vault"),
                 questionary.Choice("Keep project agents only", value="project"),
             ],
-            style=CUSTOM_STYLE,
+            style=style,
         ).ask()
     return "vault"
@@ -1,9 +1,12 @@
+import errno
 import json
 import logging
+import os
 import re
 import shutil
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple, Union
 
 import yaml
 
@@ -56,20 +59,39 @@ def get_master_agent_dir() -> Path:
     return legacy_path
 
 
+@lru_cache(maxsize=1)
+def master_agent_dir_status() -> Tuple[Path, bool]:
+    """
+    Memoized ``(get_master_agent_dir(), exists)`` for the current process.
+
+    ``VaultManager.sync``/``add``/``remove`` clear the cache, since they can
+    create or delete the XDG cache directory.
+    """
+    master_path = get_master_agent_dir()
+    return master_path, master_path.exists()
+
+
 # =============================================================================
 # MCP CONFIGURATION
 # =============================================================================
 
 
+def dir_children(path) -> frozenset:
+    """Names of the entries in ``path`` from one scandir; empty if it is missing or not a directory."""
+    try:
+        with os.scandir(path) as it:
+            return frozenset(e.name for e in it)
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
+
+
 def load_mcp_config(source_root: Path) -> Optional[Dict[str, Any]]:
     """Load MCP configuration from .agent/mcp_config.json."""
     mcp_file = source_root / ".agent" / "mcp_config.json"
-    if mcp_file.exists():
-        try:
-            return json.loads(mcp_file.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            return None
-    return None
+    try:
+        return json.loads(mcp_file.read_text(encoding="utf-8"))
+    except (FileNotFoundError, NotADirectoryError, json.JSONDecodeError):
+        return None
 
 
 def write_mcp_config(dest_path: Path, config: Dict[str, Any]) -> bool:
@@ -217,6 +239,138 @@ def safe_read_text(path: Path, encoding: str = "utf-8") -> Optional[str]:
     return None
 
 
+_COPY_CHUNK = 1 << 30
+# Files at least this large get a sequential-access + prefetch hint before copying
+_SEQUENTIAL_HINT_MIN = 64 * 1024
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+# Cleared once the kernel/filesystem rejects copy_file_range, so later copies skip it
+_copy_file_range_supported = hasattr(os, "copy_file_range")
+
+
+def _hint_sequential(fd: int) -> None:
+    """
+    posix_fadvise SEQUENTIAL + WILLNEED: widen the readahead window and queue an
+    async read of the whole file (the portable readahead(2)); returns at once.
+    """
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+
+
+def fast_copy_file(src: Union[str, "os.PathLike[str]"], dest: Union[str, "os.PathLike[str]"]) -> None:
+    """
+    Copy a single file with metadata (like shutil.copy2).
+
+    Uses os.copy_file_range where available so data stays in kernel space (and
+    becomes a reflink or server-side copy on filesystems that support it); falls
+    back to shutil.copyfileobj if the kernel/filesystem refuses.
+    """
+    global _copy_file_range_supported
+    with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+        copied = False
+        if _copy_file_range_supported:
+            in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+            size = os.fstat(in_fd).st_size
+            if _HAS_FADVISE and size >= _SEQUENTIAL_HINT_MIN:
+                _hint_sequential(in_fd)
+            try:
+                sent = os.copy_file_range(in_fd, out_fd, _COPY_CHUNK)
+                # Some filesystems (procfs/sysfs-like, some FUSE mounts) report 0 for
+                # non-empty files; treat that as "unsupported" rather than EOF.
+                if sent or size == 0:
+                    # The kernel may copy less than requested: loop until EOF
+                    while sent:
+                        sent = os.copy_file_range(in_fd, out_fd, _COPY_CHUNK)
+                    copied = True
+            except OSError as e:
+                if e.errno in (errno.ENOSYS, errno.EXDEV, errno.EOPNOTSUPP, errno.EINVAL):
+                    _copy_file_range_supported = False
+            if not copied:
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+        if not copied:
+            shutil.copyfileobj(fsrc, fdst)
+    shutil.copystat(src, dest)
+
+
+def copytree_scandir(
+    src: str,
+    dst: str,
+    rel: str = "",
+    listing: Optional[Dict[str, Tuple[int, int, int]]] = None,
+) -> Dict[str, Tuple[int, int, int]]:
+    """
+    Copy a directory tree with os.scandir, recording per-directory stats in the same pass.
+
+    Returns:
+        Dict {relative path: (entry count, subdir count, .md file count)}; the root is "".
+        Lets callers count agents/skills without stat-ing the tree again after copying.
+    """
+    if listing is None:
+        listing = {}
+        os.makedirs(dst)
+    else:
+        os.mkdir(dst)
+    entries = dirs = md_files = 0
+    with os.scandir(src) as it:
+        for entry in it:
+            entries += 1
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir():
+                dirs += 1
+                copytree_scandir(entry.path, target, os.path.join(rel, entry.name), listing)
+            else:
+                if entry.name.endswith(".md"):
+                    md_files += 1
+                shutil.copy2(entry.path, target)
+    listing[rel] = (entries, dirs, md_files)
+    return listing
+
+
+# os.fwalk + dir_fd are POSIX-only
+HAS_FWALK = hasattr(os, "fwalk") and os.unlink in os.supports_dir_fd
+
+
+def fast_rmtree(path: Path, ignore_errors: bool = False) -> None:
+    """
+    Remove a directory tree, listing each directory only once.
+
+    POSIX: bottom-up os.fwalk with unlink/rmdir relative to dir_fd, so no
+    per-entry path resolution. Elsewhere: recursive os.scandir. Symlinks are
+    unlinked, never followed. On OSError falls back to shutil.rmtree, which
+    raises FileNotFoundError for a missing path unless ignore_errors is set.
+    """
+    if HAS_FWALK:
+        try:
+            for _root, dirs, files, root_fd in os.fwalk(path, topdown=False):
+                for fname in files:
+                    os.unlink(fname, dir_fd=root_fd)
+                for dname in dirs:
+                    try:
+                        os.rmdir(dname, dir_fd=root_fd)
+                    except NotADirectoryError:
+                        # fwalk lists symlinks-to-dirs in dirs without descending
+                        os.unlink(dname, dir_fd=root_fd)
+            os.rmdir(path)
+        except OSError:
+            shutil.rmtree(path, ignore_errors=ignore_errors)
+        return
+
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    fast_rmtree(Path(entry.path), ignore_errors)
+                else:
+                    os.unlink(entry.path)
+        os.rmdir(path)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=ignore_errors)
+
+
 def safe_copy(src: Path, dest: Path, overwrite: bool = True) -> bool:
     """Safely copy file or directory."""
     try:
@@ -276,20 +430,22 @@ def strip_frontmatter(content: str) -> str:
     return _RE_FRONTMATTER_STRIP.sub("", content)
 
 
-def resolve_source_root(source_dir: str) -> Optional[Path]:
+def resolve_source_root(source_dir: Union[str, "os.PathLike[str]"]) -> Optional[Path]:
     """
     Resolve source root containing .agent/ directory.
+    Accepts a str or path-like; no str() round-trip needed.
     Returns None if no source found.
     """
-    root_path = Path(source_dir).resolve()
+    # abspath is lexical (no realpath walk); callers only need an absolute path here
+    root_path = Path(os.path.abspath(source_dir))
 
     if root_path.name == ".agent":
         return root_path.parent
-    elif (root_path / ".agent").exists():
+    elif ".agent" in dir_children(root_path):
         return root_path
     else:
-        master_path = get_master_agent_dir()
-        if master_path.exists():
+        master_path, master_exists = master_agent_dir_status()
+        if master_exists:
             print(f"{Colors.YELLOW}🔔 Local .agent not found, using Master Vault: {master_path}{Colors.ENDC}")
             return master_path.parent
 
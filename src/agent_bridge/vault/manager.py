@@ -4,10 +4,15 @@ Moved from vault.py with source abstraction integration.
 """
 
 import json
+import os
 import shutil
-from dataclasses import asdict, dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from agent_bridge.utils import master_agent_dir_status
 
 from .sources import BuiltinSource, GitSource, LocalSource
 from .merger import merge_source_into_project, MergeStrategy, MERGE_SUBDIRS
@@ -26,6 +31,18 @@ DEFAULT_VAULT = {
 }
 
 
+# Cache parse vaults.json theo (path, mtime_ns, size) — nhieu VaultManager trong 1 lan chay
+_CONFIG_CACHE: Dict[Tuple[str, int, int], List["Vault"]] = {}
+
+
+def _config_cache_key() -> Optional[Tuple[str, int, int]]:
+    try:
+        st = VAULTS_CONFIG_FILE.stat()
+    except OSError:
+        return None
+    return (str(VAULTS_CONFIG_FILE), st.st_mtime_ns, st.st_size)
+
+
 @dataclass
 class Vault:
     name: str
@@ -47,6 +64,22 @@ class Vault:
     def cache_path(self) -> Path:
         return VAULTS_CACHE_DIR / self.name
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict phang cua cac field (thay asdict() — khong can deepcopy de quy cho dataclass phang)."""
+        return {
+            "name": self.name,
+            "url": self.url,
+            "description": self.description,
+            "agent_subdir": self.agent_subdir,
+            "enabled": self.enabled,
+            "priority": self.priority,
+        }
+
+    @cached_property
+    def resolved_local(self) -> Path:
+        """Duong dan tuyet doi cua local vault (resolve 1 lan moi instance)."""
+        return Path(self.url).resolve()
+
     def get_source(self):
         if self.is_builtin:
             return BuiltinSource()
@@ -58,37 +91,63 @@ class Vault:
 class VaultManager:
     def __init__(self):
         self._vaults: List[Vault] = []
+        self._sorted_cache: Optional[List[Vault]] = None
+        self._enabled_cache: Optional[List[Vault]] = None
         self._load_config()
 
+    def _invalidate(self) -> None:
+        self._sorted_cache = None
+        self._enabled_cache = None
+
     def _load_config(self) -> None:
-        if VAULTS_CONFIG_FILE.exists():
-            try:
-                data = json.loads(VAULTS_CONFIG_FILE.read_text(encoding="utf-8"))
-                self._vaults = [Vault(**v) for v in data.get("vaults", [])]
-            except (json.JSONDecodeError, TypeError, KeyError):
-                self._vaults = [Vault(**DEFAULT_VAULT)]
-        else:
+        self._invalidate()
+        key = _config_cache_key()
+        if key is None:
             self._vaults = [Vault(**DEFAULT_VAULT)]
+            return
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None:
+            self._vaults = [replace(v) for v in cached]
+            return
+        try:
+            data = json.loads(VAULTS_CONFIG_FILE.read_text(encoding="utf-8"))
+            self._vaults = [Vault(**v) for v in data.get("vaults", [])]
+        except (json.JSONDecodeError, TypeError, KeyError):
+            self._vaults = [Vault(**DEFAULT_VAULT)]
+            return
+        _CONFIG_CACHE[key] = [replace(v) for v in self._vaults]
 
     def _save_config(self) -> None:
         VAULTS_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        data = {"vaults": [asdict(v) for v in self._vaults]}
+        data = {"vaults": [v.to_dict() for v in self._vaults]}
         VAULTS_CONFIG_FILE.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        _CONFIG_CACHE.clear()
+        key = _config_cache_key()
+        if key is not None:
+            _CONFIG_CACHE[key] = [replace(v) for v in self._vaults]
 
     @property
     def vaults(self) -> List[Vault]:
-        return sorted(self._vaults, key=lambda v: v.priority)
+        # Cache danh sach da sort; _invalidate() khi add/remove/_load_config.
+        # Tra ve ban copy de caller sua list khong lam hong cache.
+        if self._sorted_cache is None:
+            self._sorted_cache = sorted(self._vaults, key=lambda v: v.priority)
+        return list(self._sorted_cache)
 
     @property
     def enabled_vaults(self) -> List[Vault]:
-        return [v for v in self.vaults if v.enabled]
+        if self._enabled_cache is None:
+            self._enabled_cache = [v for v in self.vaults if v.enabled]
+        return list(self._enabled_cache)
 
     def add(self, name: str, url: str, description: str = "", priority: int = 100) -> Vault:
         if any(v.name == name for v in self._vaults):
             raise ValueError(f"Vault '{name}' already exists. Remove it first.")
         vault = Vault(name=name, url=url, description=description, priority=priority)
         self._vaults.append(vault)
+        self._invalidate()
         self._save_config()
+        master_agent_dir_status.cache_clear()
         return vault
 
     def remove(self, name: str) -> bool:
@@ -96,9 +155,11 @@ class VaultManager:
         if not vault:
             return False
         self._vaults = [v for v in self._vaults if v.name != name]
+        self._invalidate()
         self._save_config()
         if vault.cache_path.exists():
             shutil.rmtree(vault.cache_path)
+        master_agent_dir_status.cache_clear()
         return True
 
     def get(self, name: str) -> Optional[Vault]:
@@ -112,21 +173,31 @@ class VaultManager:
         targets = [self.get(name)] if name else self.enabled_vaults
         targets = [t for t in targets if t is not None]
 
-        for vault in targets:
-            if verbose:
-                print(f"  Syncing vault: {vault.name} ...")
-            source = vault.get_source()
-            results[vault.name] = source.sync(vault.cache_path, verbose)
+        if not targets:
+            return results
+
+        # Moi vault co cache_path rieng, sync (git clone/pull) la network I/O -> chay song song.
+        # Print o main thread de output khong xen ke.
+        with ThreadPoolExecutor(max_workers=min(8, len(targets))) as pool:
+            futures = []
+            for vault in targets:
+                if verbose:
+                    print(f"  Syncing vault: {vault.name} ...")
+                futures.append(pool.submit(vault.get_source().sync, vault.cache_path, False))
+            for vault, future in zip(targets, futures):
+                results[vault.name] = future.result()
+        # Sync co the vua tao/xoa XDG cache -> master dir da memo khong con dung
+        master_agent_dir_status.cache_clear()
 
         return results
 
     def get_vault_agent_dir(self, vault: Vault) -> Optional[Path]:
         """Get the .agent/ directory for a vault (cached or local)."""
         if vault.is_local:
-            candidate = Path(vault.url).resolve() / vault.agent_subdir
+            candidate = vault.resolved_local / vault.agent_subdir
         else:
             candidate = vault.cache_path / vault.agent_subdir
-        return candidate if candidate.exists() else None
+        return candidate if os.path.isdir(candidate) else None
 
     def get_first_available_agent_dir(self) -> Optional[Path]:
         """Get agent dir from highest-priority vault that has content."""
@@ -154,7 +225,7 @@ class VaultManager:
     def list_vaults(self) -> List[Dict[str, Any]]:
         result = []
         for v in self.vaults:
-            info = asdict(v)
+            info = v.to_dict()
             info["cached"] = v.cache_path.exists() if not v.is_local else True
             result.append(info)
         return result
\ No newline at end of file
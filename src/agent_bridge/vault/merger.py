@@ -3,11 +3,14 @@ Vault merge strategies.
 Previously scattered across cli.py (_fetch_vault_to_project, _merge_vault_to_project).
 """
 
+import os
 import shutil
 from enum import Enum
 from pathlib import Path
 from typing import Dict, List
 
+from agent_bridge.utils import copytree_scandir
+
 MERGE_SUBDIRS = ["agents", "skills", "workflows", "rules"]
 
 
@@ -27,11 +30,10 @@ def merge_source_into_project(
     if strategy == MergeStrategy.VAULT_ONLY:
         if project_agent_dir.exists():
             shutil.rmtree(project_agent_dir)
-        shutil.copytree(source_dir, project_agent_dir)
+        listing = copytree_scandir(str(source_dir), str(project_agent_dir))
         for subdir in MERGE_SUBDIRS:
-            sub = project_agent_dir / subdir
-            if sub.exists():
-                counts[subdir] = sum(1 for _ in sub.iterdir())
+            if subdir in listing:
+                counts[subdir] = listing[subdir][0]
         return counts
 
     project_agent_dir.mkdir(parents=True, exist_ok=True)
@@ -39,25 +41,37 @@ def merge_source_into_project(
     for subdir in MERGE_SUBDIRS:
         src = source_dir / subdir
         dst = project_agent_dir / subdir
-        if not src.exists():
+        try:
+            src_entries = os.scandir(src)
+        except (FileNotFoundError, NotADirectoryError):
             continue
-        dst.mkdir(parents=True, exist_ok=True)
-        merged = 0
-        for item in src.iterdir():
-            dest_item = dst / item.name
-            if dest_item.exists() and strategy == MergeStrategy.PROJECT_WINS:
-                continue
-            if dest_item.exists() and strategy == MergeStrategy.VAULT_WINS:
-                if dest_item.is_dir():
-                    shutil.rmtree(dest_item)
-                else:
-                    dest_item.unlink()
-            if not dest_item.exists():
-                if item.is_dir():
-                    shutil.copytree(item, dest_item)
+        # with ngay sau khi mo: loi o buoc scandir/mkdir dst van dong iterator src
+        with src_entries:
+            # Mot lan scandir dst thay vi exists() cho tung item; cap nhat set sau moi lan copy.
+            # Project da setup (truong hop pho bien) -> khong can mkdir.
+            try:
+                with os.scandir(dst) as it:
+                    existing = {e.name for e in it}
+            except FileNotFoundError:
+                dst.mkdir(parents=True, exist_ok=True)
+                existing = set()
+            dst_str = str(dst)
+            merged = 0
+            for entry in src_entries:
+                dest_item = os.path.join(dst_str, entry.name)
+                if entry.name in existing:
+                    if strategy == MergeStrategy.PROJECT_WINS:
+                        continue
+                    if os.path.isdir(dest_item) and not os.path.islink(dest_item):
+                        shutil.rmtree(dest_item)
+                    else:
+                        os.unlink(dest_item)
+                if entry.is_dir():
+                    shutil.copytree(entry.path, dest_item)
                 else:
-                    shutil.copy2(item, dest_item)
+                    shutil.copy2(entry.path, dest_item)
+                existing.add(entry.name)
                 merged += 1
         counts[subdir] = merged
 
-    return counts
\ No newline at end of file
+    return counts
@@ -5,9 +5,29 @@ Each source knows how to sync/validate itself.
 
 from abc import ABC, abstractmethod
 from pathlib import Path
+import os
 import shutil
 import subprocess
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+
+from agent_bridge.utils import copytree_scandir
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _count_content_cached(
+    agents_dir: str, agents_mtime: Optional[int], skills_dir: str, skills_mtime: Optional[int]
+) -> Tuple[Tuple[str, int], ...]:
+    agents = len(list(Path(agents_dir).glob("*.md"))) if agents_mtime is not None else 0
+    skills = sum(1 for d in Path(skills_dir).iterdir() if d.is_dir()) if skills_mtime is not None else 0
+    return (("agents", agents), ("skills", skills))
 
 
 class VaultSource(ABC):
@@ -19,12 +39,11 @@ class VaultSource(ABC):
 
     @staticmethod
     def _count_content(agent_dir: Path) -> Dict[str, int]:
-        agents_dir = agent_dir / "agents"
-        skills_dir = agent_dir / "skills"
-        return {
-            "agents": len(list(agents_dir.glob("*.md"))) if agents_dir.exists() else 0,
-            "skills": sum(1 for d in skills_dir.iterdir() if d.is_dir()) if skills_dir.exists() else 0,
-        }
+        # Them/xoa entry lam doi mtime cua chinh thu muc do, nen key theo mtime cua
+        # agents/ va skills/ (khong phai agent_dir) la du de biet khi nao can dem lai.
+        agents_dir = os.path.join(agent_dir, "agents")
+        skills_dir = os.path.join(agent_dir, "skills")
+        return dict(_count_content_cached(agents_dir, _mtime_ns(agents_dir), skills_dir, _mtime_ns(skills_dir)))
 
 
 class GitSource(VaultSource):
@@ -34,13 +53,23 @@ class GitSource(VaultSource):
     def sync(self, cache_dir: Path, verbose: bool = True) -> Dict[str, Any]:
         stats: Dict[str, Any] = {"status": "ok", "agents": 0, "skills": 0}
         try:
-            if cache_dir.exists() and (cache_dir / ".git").exists():
-                subprocess.run(["git", "-C", str(cache_dir), "pull", "--ff-only"], check=True, capture_output=True)
+            if self._is_repo(cache_dir):
+                # Remote HEAD khong doi -> bo qua fetch, chi dem lai noi dung.
+                # Cache chi doc: fetch tip moi nhat roi reset, khong can merge history
+                if not self._is_up_to_date(cache_dir):
+                    self._fetch_and_reset(cache_dir)
             else:
                 cache_dir.parent.mkdir(parents=True, exist_ok=True)
                 if cache_dir.exists():
                     shutil.rmtree(cache_dir)
-                subprocess.run(["git", "clone", "--depth", "1", self.url, str(cache_dir)], check=True, capture_output=True)
+                subprocess.run(
+                    [
+                        "git", "clone", "--depth", "1", "--single-branch", "--no-tags", "--filter=blob:none",
+                        self.url, str(cache_dir),
+                    ],
+                    check=True,
+                    capture_output=True,
+                )
 
             for subdir_name in [".agent", "."]:
                 agent_dir = cache_dir / subdir_name
@@ -53,6 +82,48 @@ class GitSource(VaultSource):
             stats["status"] = f"error: {e}"
         return stats
 
+    @staticmethod
+    def _is_repo(cache_dir: Path) -> bool:
+        """
+        Hoi git thay vi chi kiem tra .git ton tai: bat duoc .git hong / clone do dang.
+        So sanh toplevel voi cache_dir de khong nham repo cha (vd ~/.config la dotfiles repo).
+        """
+        try:
+            probe = subprocess.run(
+                ["git", "-C", str(cache_dir), "rev-parse", "--show-toplevel"], capture_output=True, timeout=10
+            )
+        except (OSError, subprocess.SubprocessError):
+            # OSError: khong tim thay git; SubprocessError: timeout
+            return False
+        if probe.returncode != 0:
+            # Gom ca cache_dir chua ton tai: git -C <missing> thoat voi ma 128
+            return False
+        return os.path.realpath(probe.stdout.decode().strip()) == os.path.realpath(cache_dir)
+
+    @staticmethod
+    def _is_up_to_date(cache_dir: Path) -> bool:
+        """So sanh HEAD local voi HEAD cua origin (ls-remote, ~vai chuc byte). Loi -> False de fetch nhu cu."""
+        try:
+            remote = subprocess.run(
+                ["git", "-C", str(cache_dir), "ls-remote", "origin", "HEAD"], capture_output=True, timeout=10
+            )
+            local = subprocess.run(["git", "-C", str(cache_dir), "rev-parse", "HEAD"], capture_output=True, timeout=10)
+        except (OSError, subprocess.SubprocessError):
+            return False
+        if remote.returncode != 0 or local.returncode != 0:
+            return False
+        remote_sha = remote.stdout.split(maxsplit=1)[0] if remote.stdout.strip() else b""
+        return bool(remote_sha) and remote_sha == local.stdout.strip()
+
+    @staticmethod
+    def _fetch_and_reset(cache_dir: Path) -> None:
+        subprocess.run(
+            ["git", "-C", str(cache_dir), "fetch", "--depth=1", "--no-tags", "--filter=blob:none", "origin"],
+            check=True,
+            capture_output=True,
+        )
+        subprocess.run(["git", "-C", str(cache_dir), "reset", "--hard", "FETCH_HEAD"], check=True, capture_output=True)
+
     def validate(self) -> bool:
         try:
             result = subprocess.run(["git", "ls-remote", "--exit-code", self.url], capture_output=True, timeout=15)
@@ -96,9 +167,13 @@ class BuiltinSource(VaultSource):
             cache_dir.parent.mkdir(parents=True, exist_ok=True)
             if cache_dir.exists():
                 shutil.rmtree(cache_dir)
-            shutil.copytree(self.source_dir, cache_dir)
-            agent_dir = cache_dir / ".agent" if (cache_dir / ".agent").exists() else cache_dir
-            stats.update(self._count_content(agent_dir))
+            # Copy va dem trong cung mot lan scandir, khong stat lai cache
+            listing = copytree_scandir(str(self.source_dir), str(cache_dir))
+            agent_rel = ".agent" if ".agent" in listing else ""
+            agents = listing.get(os.path.join(agent_rel, "agents"))
+            skills = listing.get(os.path.join(agent_rel, "skills"))
+            stats["agents"] = agents[2] if agents else 0
+            stats["skills"] = skills[1] if skills else 0
         except Exception as e:
             stats["status"] = f"error: {e}"
         return stats
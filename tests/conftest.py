@@ -1,27 +1,19 @@
 """Shared fixtures for tests."""
 
-import re
+import os
+import shutil
 
 import pytest
 from pathlib import Path
 import json
 
+from tests.helpers import strip_and_normalize
 
-def strip_and_normalize(content: str) -> str:
-    """
-    Strip frontmatter, credit lines, and normalize whitespace for comparison.
-
-    Dung cho roundtrip tests - so sanh noi dung semantic, khong phai format chinh xac.
-    """
-    content = re.sub(r"^---\n.*?\n---\n*", "", content, flags=re.DOTALL)
-    content = re.sub(r"\n*---\n\*Generated by \[Agent Bridge\].*?\*\n?", "", content, flags=re.IGNORECASE)
-    return content.strip()
 
-
-@pytest.fixture
-def tmp_project(tmp_path):
-    """Create a minimal project with .agent/ structure."""
-    agent_dir = tmp_path / ".agent"
+@pytest.fixture(scope="session")
+def _canonical_agent_dir(tmp_path_factory):
+    """Build the sample .agent/ tree once per session; tests get their own copy."""
+    agent_dir = tmp_path_factory.mktemp("canonical_project") / ".agent"
     (agent_dir / "agents").mkdir(parents=True)
     (agent_dir / "skills").mkdir(parents=True)
     (agent_dir / "workflows").mkdir(parents=True)
@@ -61,18 +53,111 @@ def tmp_project(tmp_path):
     }
     (agent_dir / "mcp_config.json").write_text(json.dumps(mcp_config, indent=2))
 
-    return tmp_path
+    return agent_dir
+
+
+@pytest.fixture(scope="session")
+def orchestrator_normalized(_canonical_agent_dir):
+    """strip_and_normalize() of the sample orchestrator.md, computed once per session."""
+    return strip_and_normalize((_canonical_agent_dir / "agents" / "orchestrator.md").read_text())
 
 
 @pytest.fixture
-def tmp_project_with_ide_outputs(tmp_project):
-    """Create a project with .agent/ AND generated IDE outputs (Cursor, Kiro, Copilot)."""
+def tmp_project(tmp_path, _canonical_agent_dir):
+    """Create a minimal project with .agent/ structure."""
+    shutil.copytree(_canonical_agent_dir, tmp_path / ".agent")
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def _base_tmp_project_with_ide_outputs(tmp_path_factory, _canonical_agent_dir):
+    """Build .agent/ plus generated IDE outputs once per session (treat as read-only)."""
     from agent_bridge.converters.cursor import CursorConverter
     from agent_bridge.converters.kiro import KiroConverter
     from agent_bridge.converters.copilot import CopilotConverter
 
+    project = tmp_path_factory.mktemp("project_with_ide_outputs")
+    shutil.copytree(_canonical_agent_dir, project / ".agent")
     for Conv in [CursorConverter, KiroConverter, CopilotConverter]:
         conv = Conv()
-        conv.convert(tmp_project, tmp_project, verbose=False)
+        conv.convert(project, project, verbose=False)
+
+    return project
+
+
+# IDE output trees that tests only read; their files are hardlinked into each copy.
+# Everything else (.agent/, .cursor/ which tests touch/utime, root files) is copied.
+_HARDLINK_DIRS = frozenset({".github", ".kiro"})
+
 
-    return tmp_project
+def _link_or_copy(src, dst):
+    """Hardlink ``src`` to ``dst``; fall back to a real copy where links are unsupported."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+def _hardlinked_file_stats(base):
+    """``{path: (size, mtime_ns)}`` for every file under the hardlinked dirs of ``base``."""
+    stats = {}
+    for name in _HARDLINK_DIRS:
+        for dirpath, _dirnames, filenames in os.walk(base / name):
+            for fname in filenames:
+                st = os.stat(os.path.join(dirpath, fname))
+                stats[os.path.join(dirpath, fname)] = (st.st_size, st.st_mtime_ns)
+    return stats
+
+
+@pytest.fixture(scope="session")
+def _base_hardlinked_stats(_base_tmp_project_with_ide_outputs):
+    return _hardlinked_file_stats(_base_tmp_project_with_ide_outputs)
+
+
+@pytest.fixture
+def tmp_project_with_ide_outputs(tmp_path, _base_tmp_project_with_ide_outputs, _base_hardlinked_stats):
+    """Create a project with .agent/ AND generated IDE outputs (Cursor, Kiro, Copilot).
+
+    Files under .github/ and .kiro/ are hardlinks into the session-wide base, so
+    tests must treat them as read-only (replace, don't rewrite in place). Teardown
+    fails the test if any shared file was modified.
+    """
+    base = _base_tmp_project_with_ide_outputs
+    project = tmp_path / "project"
+    project.mkdir()
+    with os.scandir(base) as it:
+        for entry in it:
+            dst = project / entry.name
+            if entry.name in _HARDLINK_DIRS:
+                shutil.copytree(entry.path, dst, copy_function=_link_or_copy)
+            elif entry.is_dir(follow_symlinks=False):
+                shutil.copytree(entry.path, dst, symlinks=True)
+            else:
+                shutil.copy2(entry.path, dst, follow_symlinks=False)
+    yield project
+
+    assert _hardlinked_file_stats(base) == _base_hardlinked_stats, (
+        "test modified a hardlinked .github/.kiro file in place; "
+        "unlink it before writing or copy it first"
+    )
+
+
+_IDE_INDEX_ROOTS = (".github", ".kiro")
+
+
+@pytest.fixture(scope="session")
+def ide_outputs_index(_base_tmp_project_with_ide_outputs):
+    """Map each IDE output dir (relative POSIX path, e.g. ``.kiro/skills``) to its ``(dirs, files)``.
+
+    Built with one ``os.walk`` per root over the session's base project; every
+    ``tmp_project_with_ide_outputs`` copy has the same layout, so tests can look
+    names up here instead of probing their copy with exists()/glob()/iterdir().
+    """
+    base = _base_tmp_project_with_ide_outputs
+    index = {}
+    for root_name in _IDE_INDEX_ROOTS:
+        for dirpath, dirnames, filenames in os.walk(base / root_name):
+            rel = Path(dirpath).relative_to(base).as_posix()
+            index[rel] = (tuple(sorted(dirnames)), tuple(sorted(filenames)))
+    return index
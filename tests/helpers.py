@@ -0,0 +1,29 @@
+"""Plain helper functions shared by tests (import from here, not from conftest)."""
+
+import os
+import re
+
+_RE_FRONTMATTER = re.compile(r"^---\n.*?\n---\n*", re.DOTALL)
+_RE_CREDIT_LINE = re.compile(r"\n*---\n\*Generated by \[Agent Bridge\].*?\*\n?", re.IGNORECASE)
+
+
+def strip_and_normalize(content: str) -> str:
+    """
+    Strip frontmatter, credit lines, and normalize whitespace for comparison.
+
+    Dung cho roundtrip tests - so sanh noi dung semantic, khong phai format chinh xac.
+    """
+    if content.startswith("---\n"):
+        content = _RE_FRONTMATTER.sub("", content, count=1)
+    content = _RE_CREDIT_LINE.sub("", content)
+    return content.strip()
+
+
+def ensure_dir(path) -> None:
+    """Create ``path`` with a single mkdir when its parent exists; tolerate an existing directory."""
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        pass
+    except FileNotFoundError:
+        os.makedirs(path, exist_ok=True)
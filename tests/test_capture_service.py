@@ -1,5 +1,7 @@
 """Tests for capture_service."""
 
+import os
+
 import pytest
 from pathlib import Path
 
@@ -62,9 +64,10 @@ def test_scan_marks_modified_files(tmp_project_with_ide_outputs):
             '{"generated_at":"2026-01-01T00:00:00Z","file_map":{".cursor/agents/orchestrator.md":".agent/agents/orchestrator.md"}}'
         )
     cursor_file = project / ".cursor" / "agents" / "orchestrator.md"
-    if not cursor_file.exists():
+    try:
+        os.utime(cursor_file, None)
+    except FileNotFoundError:
         pytest.skip("No cursor agents")
-    cursor_file.touch()
 
     files = scan_for_captures(project, ide_names=["cursor"])
     agent_files = [f for f in files if "orchestrator" in str(f.ide_path)]
@@ -78,7 +81,7 @@ def test_capture_dry_run_no_writes(tmp_project_with_ide_outputs):
     agent_dir = project / ".agent"
     orig_orchestrator = (agent_dir / "agents" / "orchestrator.md").read_text() if (agent_dir / "agents" / "orchestrator.md").exists() else ""
 
-    files = scan_for_captures(project)
+    files = scan_for_captures(project, ide_names=["cursor"])
     result = execute_capture(project, files, strategy="ide_wins", dry_run=True)
 
     assert result.get("dry_run") is True
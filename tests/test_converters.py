@@ -1,7 +1,6 @@
+from functools import lru_cache
 from pathlib import Path
 
-import yaml
-
 from agent_bridge.converters.copilot import (
     AGENT_SUBAGENTS_MAP,
     _role_to_copilot_tools,
@@ -9,21 +8,26 @@ from agent_bridge.converters.copilot import (
     convert_to_copilot,
     generate_copilot_frontmatter,
 )
+from tests.helpers import ensure_dir
 
 
 def _write_agent_source(source_root: Path, file_name: str, content: str) -> None:
     agents_dir = source_root / ".agent" / "agents"
-    agents_dir.mkdir(parents=True, exist_ok=True)
-    (agents_dir / file_name).write_text(content, encoding="utf-8")
+    ensure_dir(agents_dir)
+    (agents_dir / file_name).write_bytes(content.encode("utf-8"))
 
 
 def _write_skill_source(source_root: Path, skill_dir_name: str, content: str) -> None:
     skill_dir = source_root / ".agent" / "skills" / skill_dir_name
-    skill_dir.mkdir(parents=True, exist_ok=True)
-    (skill_dir / "SKILL.md").write_text(content, encoding="utf-8")
+    ensure_dir(skill_dir)
+    (skill_dir / "SKILL.md").write_bytes(content.encode("utf-8"))
 
 
+@lru_cache(maxsize=128)
 def _split_frontmatter(markdown: str) -> tuple[dict, str]:
+    """Parse frontmatter with the C loader when available. Callers must not mutate the dict."""
+    import yaml
+
     if not markdown.startswith("---\n"):
         raise AssertionError("frontmatter start marker is missing")
 
@@ -31,7 +35,7 @@ def _split_frontmatter(markdown: str) -> tuple[dict, str]:
     if len(parts) < 3:
         raise AssertionError("invalid frontmatter layout")
 
-    frontmatter = yaml.safe_load(parts[1])
+    frontmatter = yaml.load(parts[1], Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
     body = parts[2].lstrip("\n")
 
     if not isinstance(frontmatter, dict):
@@ -82,6 +86,8 @@ def _assert_valid_skill_frontmatter(frontmatter: dict) -> None:
 
 
 def test_generate_frontmatter_adds_agent_tool_when_subagents_enabled() -> None:
+    import yaml
+
     metadata = {
         "name": "Orchestrator",
         "description": "Coordinates execution",
@@ -95,6 +101,8 @@ def test_generate_frontmatter_adds_agent_tool_when_subagents_enabled() -> None:
 
 
 def test_generate_frontmatter_keeps_model_unspecified_for_handoff_flexibility() -> None:
+    import yaml
+
     metadata = {
         "name": "Planner",
         "description": "Planning agent",
@@ -141,12 +149,12 @@ Run tests with Playwright.
     assert agent_output.exists()
     assert skill_output.exists()
 
-    agent_frontmatter, agent_body = _split_frontmatter(agent_output.read_text(encoding="utf-8"))
+    agent_frontmatter, agent_body = _split_frontmatter(agent_output.read_bytes().decode("utf-8"))
     _assert_valid_agent_frontmatter(agent_frontmatter)
     assert "coordinator agent" in agent_body
-    assert "applyTo" not in agent_output.read_text(encoding="utf-8")
+    assert "applyTo" not in agent_output.read_bytes().decode("utf-8")
 
-    skill_frontmatter, _ = _split_frontmatter(skill_output.read_text(encoding="utf-8"))
+    skill_frontmatter, _ = _split_frontmatter(skill_output.read_bytes().decode("utf-8"))
     _assert_valid_skill_frontmatter(skill_frontmatter)
 
 
@@ -155,7 +163,7 @@ def test_convert_skill_to_copilot_normalizes_name_and_truncates_description(tmp_
     source_skill_dir.mkdir(parents=True)
 
     long_description = "Description: " + ("x" * 1200)
-    (source_skill_dir / "SKILL.md").write_text(long_description, encoding="utf-8")
+    (source_skill_dir / "SKILL.md").write_bytes(long_description.encode("utf-8"))
 
     dest_root = tmp_path / "dest-skills"
     ok = convert_skill_to_copilot(source_skill_dir, dest_root)
@@ -164,11 +172,13 @@ def test_convert_skill_to_copilot_normalizes_name_and_truncates_description(tmp_
     generated_file = dest_root / source_skill_dir.name / "SKILL.md"
     assert generated_file.exists()
 
-    frontmatter, _ = _split_frontmatter(generated_file.read_text(encoding="utf-8"))
+    frontmatter, _ = _split_frontmatter(generated_file.read_bytes().decode("utf-8"))
     _assert_valid_skill_frontmatter(frontmatter)
 
 
 def test_default_tools_for_unknown_agent_are_stable() -> None:
+    import yaml
+
     parsed = yaml.safe_load(
         generate_copilot_frontmatter(
             "unknown-role",
@@ -210,14 +220,14 @@ $ARGUMENTS
 
 This helps you brainstorm ideas.
 """
-    (workflow_dir / "brainstorm.md").write_text(workflow_content)
+    (workflow_dir / "brainstorm.md").write_bytes(workflow_content.encode("utf-8"))
 
     dest_file = tmp_path / ".github" / "prompts" / "brainstorm.prompt.md"
     result = convert_workflow_to_prompt(workflow_dir / "brainstorm.md", dest_file)
     assert result is True
     assert dest_file.exists()
 
-    content = dest_file.read_text()
+    content = dest_file.read_bytes().decode("utf-8")
     assert "description: Test workflow for brainstorming" in content
     assert "agent: ask" in content
     assert "$ARGUMENTS" in content
@@ -240,14 +250,14 @@ name: Python Standards
 - Use PEP 8
 - Type hints required
 """
-    (rule_dir / "python-standards.md").write_text(rule_content)
+    (rule_dir / "python-standards.md").write_bytes(rule_content.encode("utf-8"))
 
     dest_file = tmp_path / ".github" / "instructions" / "python-standards.instructions.md"
     result = convert_rule_to_instruction(rule_dir / "python-standards.md", dest_file)
     assert result is True
     assert dest_file.exists()
 
-    content = dest_file.read_text()
+    content = dest_file.read_bytes().decode("utf-8")
     assert "name: Python Standards" in content
     assert "applyTo: '**'" in content  # always_on -> **
     assert "Use PEP 8" in content
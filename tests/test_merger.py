@@ -105,3 +105,43 @@ def test_merge_counts_correct(tmp_path):
     assert counts["agents"] == 2
     assert counts["skills"] == 1
     assert counts["workflows"] == 1
+
+
+def test_merge_closes_source_scandir_when_dest_fails(tmp_path, monkeypatch):
+    """A dest subdir that is a file raises, but the source scandir is still closed."""
+    import os
+
+    from agent_bridge.vault import merger
+
+    source = tmp_path / "source" / ".agent"
+    dest = tmp_path / "dest" / ".agent"
+    (source / "agents").mkdir(parents=True)
+    (source / "agents" / "a.md").write_text("a")
+    dest.mkdir(parents=True)
+    (dest / "agents").write_text("not a directory")
+
+    opened = []
+    real_scandir = os.scandir
+
+    class _TrackedScandir:
+        def __init__(self, path):
+            self._it = real_scandir(path)
+            self.closed = False
+            opened.append(self)
+
+        def __iter__(self):
+            return iter(self._it)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self.closed = True
+            self._it.close()
+
+    monkeypatch.setattr(merger.os, "scandir", _TrackedScandir)
+
+    with pytest.raises(NotADirectoryError):
+        merge_source_into_project(source, dest, MergeStrategy.PROJECT_WINS)
+
+    assert opened and all(it.closed for it in opened)
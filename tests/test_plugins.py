@@ -2,7 +2,10 @@
 
 import json
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
 
 from agent_bridge.core.plugins import (
     Plugin,
@@ -11,6 +14,7 @@ from agent_bridge.core.plugins import (
     load_plugins,
     _check_tool_available,
 )
+from tests.helpers import ensure_dir
 
 
 # =============================================================================
@@ -21,12 +25,9 @@ from agent_bridge.core.plugins import (
 def _create_plugins_json(tmp_path: Path, plugins_data: list) -> Path:
     """Create .agent/plugins.json in tmp_path."""
     agent_dir = tmp_path / ".agent"
-    agent_dir.mkdir(parents=True, exist_ok=True)
+    ensure_dir(agent_dir)
     plugins_file = agent_dir / "plugins.json"
-    plugins_file.write_text(
-        json.dumps({"plugins": plugins_data}, indent=2),
-        encoding="utf-8",
-    )
+    plugins_file.write_bytes(json.dumps({"plugins": plugins_data}, indent=2).encode("utf-8"))
     return tmp_path
 
 
@@ -54,6 +55,14 @@ def _sample_plugin_dict(**overrides) -> dict:
     return base
 
 
+@pytest.fixture
+def workflows_dir(tmp_path: Path) -> Path:
+    """Create tmp_path/.agent/workflows (the sample plugin's trigger directory)."""
+    d = tmp_path / ".agent" / "workflows"
+    d.mkdir(parents=True)
+    return d
+
+
 # =============================================================================
 # LOADING TESTS
 # =============================================================================
@@ -79,7 +88,7 @@ def test_load_plugins_returns_empty_when_no_file(tmp_path: Path) -> None:
 def test_load_plugins_handles_malformed_json(tmp_path: Path) -> None:
     agent_dir = tmp_path / ".agent"
     agent_dir.mkdir(parents=True)
-    (agent_dir / "plugins.json").write_text("not valid json {{{", encoding="utf-8")
+    (agent_dir / "plugins.json").write_bytes(b"not valid json {{{")
     plugins = load_plugins(tmp_path)
     assert plugins == []
 
@@ -110,37 +119,48 @@ def test_load_multiple_plugins(tmp_path: Path) -> None:
 # =============================================================================
 
 
-def test_condition_file_exists_true(tmp_path: Path) -> None:
-    trigger_file = tmp_path / ".agent" / "workflows" / "test-plugin.md"
-    trigger_file.parent.mkdir(parents=True)
-    trigger_file.write_text("# Test", encoding="utf-8")
-
-    plugin = Plugin.from_dict(_sample_plugin_dict())
-    assert check_condition(plugin, tmp_path) is True
+@pytest.mark.parametrize(
+    "condition, create_trigger, expected",
+    [
+        ({"file_exists": ".agent/workflows/test-plugin.md"}, True, True),
+        ({"file_exists": ".agent/workflows/test-plugin.md"}, False, False),
+        ({"always": True}, False, True),
+        ({}, False, True),  # empty condition means always
+    ],
+    ids=["file-exists-true", "file-exists-false", "always", "empty-means-always"],
+)
+def test_check_condition(
+    tmp_path: Path, workflows_dir: Path, condition: dict, create_trigger: bool, expected: bool
+) -> None:
+    if create_trigger:
+        (workflows_dir / "test-plugin.md").write_bytes(b"# Test")
 
+    plugin = Plugin.from_dict(_sample_plugin_dict(condition=condition))
+    assert check_condition(plugin, tmp_path) is expected
 
-def test_condition_file_exists_false(tmp_path: Path) -> None:
-    plugin = Plugin.from_dict(_sample_plugin_dict())
-    assert check_condition(plugin, tmp_path) is False
 
+# =============================================================================
+# PLUGIN RUNNER TESTS
+# =============================================================================
 
-def test_condition_always(tmp_path: Path) -> None:
-    data = _sample_plugin_dict()
-    data["condition"] = {"always": True}
-    plugin = Plugin.from_dict(data)
-    assert check_condition(plugin, tmp_path) is True
 
+@pytest.fixture
+def mocked_subproc(monkeypatch):
+    """Prerequisites always succeed; subprocess.run is a recording stub returned for tweaking.
 
-def test_condition_empty_means_always(tmp_path: Path) -> None:
-    data = _sample_plugin_dict()
-    data["condition"] = {}
-    plugin = Plugin.from_dict(data)
-    assert check_condition(plugin, tmp_path) is True
+    Set ``.rc`` / ``.stderr`` to change the result; each call's argv lands in ``.calls``.
+    """
 
+    def fake_run(cmd, *args, **kwargs):
+        fake_run.calls.append(cmd)
+        return SimpleNamespace(returncode=fake_run.rc, stdout="", stderr=fake_run.stderr)
 
-# =============================================================================
-# PLUGIN RUNNER TESTS
-# =============================================================================
+    fake_run.calls = []
+    fake_run.rc = 0
+    fake_run.stderr = ""
+    monkeypatch.setattr("agent_bridge.core.plugins._install_prerequisite", lambda *a, **k: True)
+    monkeypatch.setattr("subprocess.run", fake_run)
+    return fake_run
 
 
 def test_runner_skips_when_condition_not_met(tmp_path: Path) -> None:
@@ -154,30 +174,23 @@ def test_runner_skips_when_condition_not_met(tmp_path: Path) -> None:
     assert results == {}
 
 
-def test_runner_runs_when_condition_met(tmp_path: Path) -> None:
+def test_runner_runs_when_condition_met(tmp_path: Path, workflows_dir: Path, mocked_subproc) -> None:
     """Plugin should run if trigger file exists and tool is available."""
     source_root = _create_plugins_json(tmp_path, [_sample_plugin_dict()])
 
     # Create trigger file
-    trigger = tmp_path / ".agent" / "workflows" / "test-plugin.md"
-    trigger.parent.mkdir(parents=True, exist_ok=True)
-    trigger.write_text("# Test", encoding="utf-8")
-
-    with patch("agent_bridge.core.plugins._install_prerequisite", return_value=True), \
-         patch("subprocess.run") as mock_run:
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+    (workflows_dir / "test-plugin.md").write_bytes(b"# Test")
 
-        runner = PluginRunner(source_root)
-        results = runner.run_for_ide("kiro", tmp_path, verbose=False, force=True)
+    runner = PluginRunner(source_root)
+    results = runner.run_for_ide("kiro", tmp_path, verbose=False, force=True)
 
     assert results.get("test-plugin") == "ok"
-    mock_run.assert_called_once()
+    assert len(mocked_subproc.calls) == 1
     # Verify the correct command was run
-    call_args = mock_run.call_args
-    assert "test-cli init --ai kiro" in call_args[0][0]
+    assert "test-cli init --ai kiro" in mocked_subproc.calls[-1]
 
 
-def test_runner_uses_correct_ide_command(tmp_path: Path) -> None:
+def test_runner_uses_correct_ide_command(tmp_path: Path, mocked_subproc) -> None:
     """Each IDE should get its own command."""
     source_root = _create_plugins_json(tmp_path, [
         _sample_plugin_dict(
@@ -185,21 +198,16 @@ def test_runner_uses_correct_ide_command(tmp_path: Path) -> None:
         ),
     ])
 
-    with patch("agent_bridge.core.plugins._install_prerequisite", return_value=True), \
-         patch("subprocess.run") as mock_run:
-        mock_run.return_value = MagicMock(returncode=0)
-
-        runner = PluginRunner(source_root)
+    runner = PluginRunner(source_root)
 
-        runner.run_for_ide("kiro", tmp_path, verbose=False, force=True)
-        assert "kiro" in mock_run.call_args[0][0]
+    runner.run_for_ide("kiro", tmp_path, verbose=False, force=True)
+    assert "kiro" in mocked_subproc.calls[-1]
 
-        mock_run.reset_mock()
-        runner.run_for_ide("cursor", tmp_path, verbose=False, force=True)
-        assert "cursor" in mock_run.call_args[0][0]
+    runner.run_for_ide("cursor", tmp_path, verbose=False, force=True)
+    assert "cursor" in mocked_subproc.calls[-1]
 
 
-def test_runner_skips_unsupported_ide(tmp_path: Path) -> None:
+def test_runner_skips_unsupported_ide(tmp_path: Path, mocked_subproc) -> None:
     """Plugin without command for an IDE should be skipped."""
     data = _sample_plugin_dict()
     data["install"]["commands"] = {"kiro": "test-cli init --ai kiro"}  # Only kiro
@@ -210,33 +218,32 @@ def test_runner_skips_unsupported_ide(tmp_path: Path) -> None:
     runner = PluginRunner(source_root)
     results = runner.run_for_ide("cursor", tmp_path, verbose=False, force=True)
     assert results == {}
+    assert mocked_subproc.calls == []
 
 
-def test_runner_handles_command_failure(tmp_path: Path) -> None:
+def test_runner_handles_command_failure(tmp_path: Path, mocked_subproc) -> None:
     """Failed commands should return error status."""
     data = _sample_plugin_dict()
     data["condition"] = {"always": True}
     source_root = _create_plugins_json(tmp_path, [data])
+    mocked_subproc.rc = 1
+    mocked_subproc.stderr = "something broke"
 
-    with patch("agent_bridge.core.plugins._install_prerequisite", return_value=True), \
-         patch("subprocess.run") as mock_run:
-        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="something broke")
-
-        runner = PluginRunner(source_root)
-        results = runner.run_for_ide("kiro", tmp_path, verbose=False, force=True)
+    runner = PluginRunner(source_root)
+    results = runner.run_for_ide("kiro", tmp_path, verbose=False, force=True)
 
     assert "error" in results.get("test-plugin", "")
 
 
-def test_runner_handles_prerequisite_failure(tmp_path: Path) -> None:
+def test_runner_handles_prerequisite_failure(tmp_path: Path, mocked_subproc, monkeypatch) -> None:
     """If prerequisite install fails, plugin should report error."""
     data = _sample_plugin_dict()
     data["condition"] = {"always": True}
     source_root = _create_plugins_json(tmp_path, [data])
+    monkeypatch.setattr("agent_bridge.core.plugins._install_prerequisite", lambda *a, **k: False)
 
-    with patch("agent_bridge.core.plugins._install_prerequisite", return_value=False):
-        runner = PluginRunner(source_root)
-        results = runner.run_for_ide("kiro", tmp_path, verbose=False, force=True)
+    runner = PluginRunner(source_root)
+    results = runner.run_for_ide("kiro", tmp_path, verbose=False, force=True)
 
     assert "prerequisite" in results.get("test-plugin", "")
 
@@ -258,6 +265,20 @@ def test_list_plugins(tmp_path: Path) -> None:
     assert len(fake_plugins) == 0
 
 
+def test_list_plugins_per_ide_keeps_order(tmp_path: Path) -> None:
+    cursor_only = _sample_plugin_dict(name="c")
+    cursor_only["install"]["commands"] = {"cursor": "test-cli init --ai cursor"}
+    source_root = _create_plugins_json(tmp_path, [
+        _sample_plugin_dict(name="a"),
+        cursor_only,
+        _sample_plugin_dict(name="b"),
+    ])
+    runner = PluginRunner(source_root)
+
+    assert [p["name"] for p in runner.list_plugins(ide_name="kiro")] == ["a", "b"]
+    assert [p["name"] for p in runner.list_plugins(ide_name="cursor")] == ["a", "c", "b"]
+
+
 # =============================================================================
 # PLUGIN DATA PARSING TESTS
 # =============================================================================
@@ -283,4 +304,36 @@ def test_plugin_from_dict_full() -> None:
     assert plugin.install.global_install is True
     assert len(plugin.install.commands) == 2
     assert plugin.condition.file_exists == ".agent/workflows/test-plugin.md"
-    assert plugin.prompt_before_install is False
\ No newline at end of file
+    assert plugin.prompt_before_install is False
+
+
+def test_load_plugins_without_orjson(tmp_path: Path, monkeypatch) -> None:
+    """Falls back to stdlib json when orjson is not installed."""
+    from agent_bridge.core import plugins as plugins_mod
+
+    monkeypatch.setattr(plugins_mod, "orjson", None)
+    source_root = _create_plugins_json(tmp_path, [_sample_plugin_dict()])
+
+    assert [p.name for p in load_plugins(source_root)] == ["test-plugin"]
+
+
+def test_check_tool_available_is_cached() -> None:
+    """Repeated lookups for the same tool only hit shutil.which once."""
+    _check_tool_available.cache_clear()
+    with patch("agent_bridge.core.plugins.shutil.which", return_value="/usr/bin/tool") as which:
+        assert _check_tool_available("tool") is True
+        assert _check_tool_available("tool") is True
+    assert which.call_count == 1
+    _check_tool_available.cache_clear()
+
+
+def test_runners_share_parsed_plugins_json(tmp_path: Path) -> None:
+    """A second PluginRunner on an unchanged plugins.json does not re-parse it."""
+    source_root = _create_plugins_json(tmp_path, [_sample_plugin_dict()])
+    PluginRunner(source_root)
+
+    with patch("agent_bridge.core.plugins.load_plugins") as load:
+        runner = PluginRunner(source_root)
+
+    load.assert_not_called()
+    assert [p.name for p in runner.plugins] == ["test-plugin"]
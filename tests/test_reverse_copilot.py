@@ -1,17 +1,16 @@
 """Tests for Copilot reverse conversion."""
 
 import pytest
-from pathlib import Path
 
-from agent_bridge.converters._copilot_impl import apply_reverse_capture_copilot, reverse_convert_copilot
+from agent_bridge.converters._copilot_impl import apply_reverse_capture_copilot
 from agent_bridge.core.types import CapturedFile
 
 
-def test_reverse_copilot_agent_strips_tools(tmp_project_with_ide_outputs):
+def test_reverse_copilot_agent_strips_tools(tmp_project_with_ide_outputs, ide_outputs_index):
     """Verify tools, agents, handoffs fields removed from output."""
     project = tmp_project_with_ide_outputs
     agent_file = project / ".github" / "agents" / "orchestrator.md"
-    if not agent_file.exists():
+    if "orchestrator.md" not in ide_outputs_index.get(".github/agents", ((), ()))[1]:
         pytest.skip("No Copilot agents")
 
     agent_dir = project / ".agent"
@@ -27,16 +26,15 @@ def test_reverse_copilot_agent_strips_tools(tmp_project_with_ide_outputs):
     assert "tools:" not in content or " tools:" not in content
 
 
-def test_reverse_copilot_skill_copies_directory(tmp_project_with_ide_outputs):
+def test_reverse_copilot_skill_copies_directory(tmp_project_with_ide_outputs, ide_outputs_index):
     """Entire skill dir should be copied back."""
     project = tmp_project_with_ide_outputs
-    skills_dir = project / ".github" / "skills"
-    if not skills_dir.exists():
+    if ".github/skills" not in ide_outputs_index:
         pytest.skip("No Copilot skills")
-    skill_dirs = [d for d in skills_dir.iterdir() if d.is_dir()]
-    if not skill_dirs:
+    skill_names = ide_outputs_index[".github/skills"][0]
+    if not skill_names:
         pytest.skip("No skill dirs")
-    skill_dir = skill_dirs[0]
+    skill_dir = project / ".github" / "skills" / skill_names[0]
     skill_md = skill_dir / "SKILL.md"
 
     agent_dir = project / ".agent"
@@ -52,16 +50,15 @@ def test_reverse_copilot_skill_copies_directory(tmp_project_with_ide_outputs):
     assert dest.exists()
 
 
-def test_reverse_copilot_prompt_renames_extension(tmp_project_with_ide_outputs):
+def test_reverse_copilot_prompt_renames_extension(tmp_project_with_ide_outputs, ide_outputs_index):
     """.prompt.md -> .md rename."""
     project = tmp_project_with_ide_outputs
-    prompts_dir = project / ".github" / "prompts"
-    if not prompts_dir.exists():
+    if ".github/prompts" not in ide_outputs_index:
         pytest.skip("No Copilot prompts")
-    prompt_files = list(prompts_dir.glob("*.prompt.md"))
-    if not prompt_files:
+    prompt_names = [n for n in ide_outputs_index[".github/prompts"][1] if n.endswith(".prompt.md")]
+    if not prompt_names:
         pytest.skip("No prompt files")
-    prompt_file = prompt_files[0]
+    prompt_file = project / ".github" / "prompts" / prompt_names[0]
     stem = prompt_file.name.replace(".prompt.md", "")
 
     agent_dir = project / ".agent"
@@ -8,7 +8,7 @@ from agent_bridge.converters._cursor_impl import (
     reverse_convert_cursor,
 )
 from agent_bridge.core.types import CapturedFile
-from tests.conftest import strip_and_normalize
+from tests.helpers import strip_and_normalize
 
 
 def test_reverse_cursor_agent(tmp_project_with_ide_outputs):
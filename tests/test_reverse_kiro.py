@@ -1,19 +1,18 @@
 """Tests for Kiro reverse conversion."""
 
 import pytest
-from pathlib import Path
 
-from agent_bridge.converters._kiro_impl import apply_reverse_capture_kiro, reverse_convert_kiro
+from agent_bridge.converters._kiro_impl import apply_reverse_capture_kiro
 from agent_bridge.core.types import CapturedFile
 
 
-def test_reverse_kiro_agent_json_to_markdown(tmp_project_with_ide_outputs):
+def test_reverse_kiro_agent_json_to_markdown(tmp_project_with_ide_outputs, ide_outputs_index):
     """Forward .agent/agents/orchestrator.md -> .kiro/agents/orchestrator.json
     reverse -> extracts 'prompt' field as markdown body."""
     project = tmp_project_with_ide_outputs
     agent_dir = project / ".agent"
     kiro_agent = project / ".kiro" / "agents" / "orchestrator.json"
-    if not kiro_agent.exists():
+    if "orchestrator.json" not in ide_outputs_index.get(".kiro/agents", ((), ()))[1]:
         pytest.skip("No Kiro agents")
 
     captured = CapturedFile(
@@ -29,16 +28,15 @@ def test_reverse_kiro_agent_json_to_markdown(tmp_project_with_ide_outputs):
     assert "orchestrator" in content.lower()
 
 
-def test_reverse_kiro_skill_direct_copy(tmp_project_with_ide_outputs):
+def test_reverse_kiro_skill_direct_copy(tmp_project_with_ide_outputs, ide_outputs_index):
     """Skills should be directly copied back."""
     project = tmp_project_with_ide_outputs
-    skills_dir = project / ".kiro" / "skills"
-    if not skills_dir.exists():
+    if ".kiro/skills" not in ide_outputs_index:
         pytest.skip("No Kiro skills")
-    skill_dirs = [d for d in skills_dir.iterdir() if d.is_dir()]
-    if not skill_dirs:
+    skill_names = ide_outputs_index[".kiro/skills"][0]
+    if not skill_names:
         pytest.skip("No skill dirs")
-    skill_dir = skill_dirs[0]
+    skill_dir = project / ".kiro" / "skills" / skill_names[0]
     skill_md = skill_dir / "SKILL.md"
 
     agent_dir = project / ".agent"
@@ -54,12 +52,12 @@ def test_reverse_kiro_skill_direct_copy(tmp_project_with_ide_outputs):
     assert dest.exists()
 
 
-def test_reverse_kiro_prompt_to_workflow(tmp_project_with_ide_outputs):
+def test_reverse_kiro_prompt_to_workflow(tmp_project_with_ide_outputs, ide_outputs_index):
     """Forward workflow -> .kiro/prompts/plan.md
     reverse -> .agent/workflows/plan.md. Verify {{args}} -> $ARGUMENTS."""
     project = tmp_project_with_ide_outputs
     prompt_file = project / ".kiro" / "prompts" / "plan.md"
-    if not prompt_file.exists():
+    if "plan.md" not in ide_outputs_index.get(".kiro/prompts", ((), ()))[1]:
         pytest.skip("No Kiro prompts")
 
     agent_dir = project / ".agent"
@@ -75,11 +73,11 @@ def test_reverse_kiro_prompt_to_workflow(tmp_project_with_ide_outputs):
     assert "$ARGUMENTS" in content or "plan" in content.lower()
 
 
-def test_reverse_kiro_steering_to_rule(tmp_project_with_ide_outputs):
+def test_reverse_kiro_steering_to_rule(tmp_project_with_ide_outputs, ide_outputs_index):
     """Forward rule -> .kiro/steering/global.md, reverse -> .agent/rules/global.md."""
     project = tmp_project_with_ide_outputs
     steering_file = project / ".kiro" / "steering" / "global.md"
-    if not steering_file.exists():
+    if "global.md" not in ide_outputs_index.get(".kiro/steering", ((), ()))[1]:
         pytest.skip("No Kiro steering")
 
     agent_dir = project / ".agent"
@@ -95,11 +93,11 @@ def test_reverse_kiro_steering_to_rule(tmp_project_with_ide_outputs):
     assert "inclusion" not in content or "always" not in content
 
 
-def test_reverse_kiro_mcp_config(tmp_project_with_ide_outputs):
+def test_reverse_kiro_mcp_config(tmp_project_with_ide_outputs, ide_outputs_index):
     """Verify .kiro/settings/mcp.json -> .agent/mcp_config.json copy."""
     project = tmp_project_with_ide_outputs
     mcp_file = project / ".kiro" / "settings" / "mcp.json"
-    if not mcp_file.exists():
+    if "mcp.json" not in ide_outputs_index.get(".kiro/settings", ((), ()))[1]:
         pytest.skip("No Kiro MCP config")
 
     agent_dir = project / ".agent"
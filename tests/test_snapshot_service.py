@@ -1,8 +1,12 @@
 """Tests for snapshot_service."""
 
+import errno
+import os
+
 import pytest
 from pathlib import Path
 
+from agent_bridge import utils
 from agent_bridge.services import snapshot_service
 
 
@@ -10,6 +14,7 @@ from agent_bridge.services import snapshot_service
 def patch_snapshots_dir(tmp_path, monkeypatch):
     """Patch SNAPSHOTS_DIR to use tmp_path for isolated tests."""
     monkeypatch.setattr(snapshot_service, "SNAPSHOTS_DIR", tmp_path / "snapshots")
+    snapshot_service.list_snapshots_cached.cache_clear()
     return tmp_path
 
 
@@ -40,14 +45,50 @@ def test_save_snapshot(tmp_project):
 
 
 def test_save_snapshot_version_bump(tmp_project):
-    """Save same name twice -> version should increment."""
+    """Save same name twice with changed content -> version should increment."""
     agent_dir = tmp_project / ".agent"
     info1 = snapshot_service.save_snapshot("flutter-v2", agent_dir)
     assert info1.version == 1
 
+    (agent_dir / "agents" / "orchestrator.md").write_text("# Orchestrator\n\nUpdated.\n")
     info2 = snapshot_service.save_snapshot("flutter-v2", agent_dir)
     assert info2.version == 2
     assert info2.name == "flutter-v2"
+    snapshot_file = info2.path / ".agent" / "agents" / "orchestrator.md"
+    assert "Updated." in snapshot_file.read_text()
+
+
+def test_save_snapshot_unchanged_skips_copy(tmp_project, monkeypatch):
+    """Save same content twice -> no re-copy, version unchanged."""
+    agent_dir = tmp_project / ".agent"
+    info1 = snapshot_service.save_snapshot("same", agent_dir, "desc")
+
+    def fail_copy_tree(*args, **kwargs):
+        raise AssertionError("copy should not run for unchanged snapshot")
+
+    monkeypatch.setattr(snapshot_service, "_copy_tree", fail_copy_tree)
+    info2 = snapshot_service.save_snapshot("same", agent_dir, "desc")
+    assert info2.version == info1.version == 1
+    assert info2.created == info1.created
+
+
+@pytest.mark.parametrize("has_fwalk", [True, False])
+def test_save_snapshot_detects_edit_in_symlinked_dir(tmp_project, tmp_path, monkeypatch, has_fwalk):
+    """Editing a file under a symlinked skill dir -> snapshot is re-copied."""
+    monkeypatch.setattr(snapshot_service, "HAS_FWALK", has_fwalk and utils.HAS_FWALK)
+    agent_dir = tmp_project / ".agent"
+    external = tmp_path / "external-skill"
+    external.mkdir()
+    skill_file = external / "SKILL.md"
+    skill_file.write_text("v1\n")
+    (agent_dir / "skills" / "linked").symlink_to(external, target_is_directory=True)
+
+    info1 = snapshot_service.save_snapshot("linked", agent_dir)
+    skill_file.write_text("v2 with more text\n")
+    info2 = snapshot_service.save_snapshot("linked", agent_dir)
+
+    assert info2.version == info1.version + 1
+    assert (info2.path / ".agent" / "skills" / "linked" / "SKILL.md").read_text() == "v2 with more text\n"
 
 
 def test_list_snapshots_empty():
@@ -70,6 +111,18 @@ def test_list_snapshots_sorted_by_date(tmp_project):
     assert result[0].name == "mid"
 
 
+def test_list_snapshots_cached_invalidated(tmp_project):
+    """Cached list refreshes after save and delete."""
+    agent_dir = tmp_project / ".agent"
+    assert snapshot_service.list_snapshots_cached() == ()
+
+    snapshot_service.save_snapshot("cached", agent_dir)
+    assert [s.name for s in snapshot_service.list_snapshots_cached()] == ["cached"]
+
+    snapshot_service.delete_snapshot("cached")
+    assert snapshot_service.list_snapshots_cached() == ()
+
+
 def test_delete_snapshot(tmp_project):
     """Delete -> dir removed, not in list."""
     agent_dir = tmp_project / ".agent"
@@ -132,9 +185,76 @@ def test_restore_snapshot(tmp_project):
     assert (restore_dir / "mcp_config.json").exists()
 
 
+def test_clone_file_copy_file_range_fallback(tmp_path, monkeypatch):
+    """No reflink: copy_file_range copies content, ENOSYS falls back to copyfileobj."""
+    monkeypatch.setattr(snapshot_service, "_reflink_supported", False)
+    src = tmp_path / "src.md"
+    src.write_bytes(b"x" * 70000 + b"\n")
+
+    if hasattr(os, "copy_file_range"):
+        monkeypatch.setattr(utils, "_copy_file_range_supported", True)
+        snapshot_service._clone_file(str(src), str(tmp_path / "a.md"))
+        assert (tmp_path / "a.md").read_bytes() == src.read_bytes()
+
+    def no_copy_file_range(*args):
+        raise OSError(errno.ENOSYS, "not implemented")
+
+    monkeypatch.setattr(utils.os, "copy_file_range", no_copy_file_range, raising=False)
+    monkeypatch.setattr(utils, "_copy_file_range_supported", True)
+    snapshot_service._clone_file(str(src), str(tmp_path / "b.md"))
+    assert (tmp_path / "b.md").read_bytes() == src.read_bytes()
+    assert utils._copy_file_range_supported is False
+
+
 def test_restore_snapshot_nonexistent(tmp_project):
     """Restore nonexistent snapshot returns False."""
     agent_dir = tmp_project / ".agent"
     agent_dir.mkdir(parents=True, exist_ok=True)
     ok = snapshot_service.restore_snapshot(agent_dir, "nonexistent")
     assert ok is False
+
+
+def test_delete_snapshot_does_not_follow_symlinks(tmp_project, tmp_path):
+    """Symlinks in a snapshot are unlinked; their external targets survive."""
+    agent_dir = tmp_project / ".agent"
+    info = snapshot_service.save_snapshot("with-link", agent_dir)
+
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "keep.md").write_text("keep")
+    (info.path / ".agent" / "linked").symlink_to(outside, target_is_directory=True)
+
+    assert snapshot_service.delete_snapshot("with-link") is True
+    assert not info.path.exists()
+    assert (outside / "keep.md").read_text() == "keep"
+
+
+def test_save_snapshot_isolated_from_source_edits(tmp_project):
+    """Editing project files after save leaves the snapshot unchanged."""
+    agent_dir = tmp_project / ".agent"
+    info = snapshot_service.save_snapshot("isolated", agent_dir)
+
+    source_file = agent_dir / "agents" / "orchestrator.md"
+    original = (info.path / ".agent" / "agents" / "orchestrator.md").read_text()
+    source_file.write_text("edited in project")
+
+    assert (info.path / ".agent" / "agents" / "orchestrator.md").read_text() == original
+
+
+def test_manifest_roundtrip_without_orjson(tmp_project, monkeypatch):
+    """Stdlib json fallback reads and writes the manifest like orjson."""
+    monkeypatch.setattr(snapshot_service, "orjson", None)
+    agent_dir = tmp_project / ".agent"
+    snapshot_service.save_snapshot("no-orjson", agent_dir, "Mô tả")
+
+    info = snapshot_service.get_snapshot("no-orjson")
+    assert info is not None
+    assert info.description == "Mô tả"
+
+
+def test_normalize_snapshot_name():
+    """Unsafe chars (ASCII and non-ASCII) become hyphens, edges trimmed."""
+    assert snapshot_service._normalize_snapshot_name("  My Snap! ") == "my-snap"
+    assert snapshot_service._normalize_snapshot_name("flutter_v2") == "flutter_v2"
+    assert snapshot_service._normalize_snapshot_name("Café v2") == "caf--v2"
+    assert snapshot_service._normalize_snapshot_name("!!!") == "unnamed"
@@ -0,0 +1,50 @@
+"""Tests for sync_service."""
+
+import sys
+
+import pytest
+
+from agent_bridge.services import sync_service
+from agent_bridge.services.sync_service import _present_output_dirs
+
+
+class _FakeVaultManager:
+    enabled_vaults = []
+
+    def sync(self, verbose=True):
+        if verbose:
+            print("  Syncing vault: fake ...")
+        return {"fake": {"status": "ok"}}
+
+    def merge_to_project(self, project_agent_dir, verbose=True):
+        return {}
+
+
+def test_present_output_dirs_nested(tmp_path):
+    """Detect top-level and nested output dirs, skip missing ones."""
+    (tmp_path / ".cursor").mkdir()
+    (tmp_path / ".vscode" / "settings").mkdir(parents=True)
+    (tmp_path / ".kiro").mkdir()
+
+    present = _present_output_dirs(tmp_path, [".cursor", ".vscode/settings", ".kiro/steering", ".windsurf", ""])
+
+    assert present == {".cursor", ".vscode/settings"}
+
+
+@pytest.mark.parametrize("quiet", [False, True])
+def test_cli_update_quiet_suppresses_vault_output(tmp_path, monkeypatch, capsys, quiet):
+    """`agent-bridge update --quiet` runs the update without per-vault output."""
+    (tmp_path / ".agent").mkdir()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sync_service, "VaultManager", _FakeVaultManager)
+    monkeypatch.setattr(sys, "argv", ["agent-bridge", "update"] + (["--quiet"] if quiet else []))
+
+    from agent_bridge.cli import _main
+
+    _main()
+
+    out = capsys.readouterr().out
+    if quiet:
+        assert out == ""
+    else:
+        assert "Syncing vault: fake" in out
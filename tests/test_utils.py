@@ -8,6 +8,7 @@ from agent_bridge.utils import (
     add_yaml_frontmatter,
     truncate_content,
     validate_path_within_project,
+    dir_children,
 )
 
 
@@ -111,3 +112,52 @@ def test_validate_path_within_project_no_project_root(tmp_path):
     # This should not raise
     result = validate_path_within_project(test_file)
     assert isinstance(result, bool)
+
+
+def test_fast_copy_file(tmp_path):
+    """Verify content and mtime copied."""
+    import os
+
+    from agent_bridge.utils import fast_copy_file
+
+    src = tmp_path / "src.json"
+    src.write_text('{"mcpServers": {}}')
+    os.utime(src, (1_000_000, 1_000_000))
+    dest = tmp_path / "dest.json"
+
+    fast_copy_file(src, dest)
+
+    assert dest.read_text() == '{"mcpServers": {}}'
+    assert dest.stat().st_mtime == 1_000_000
+
+
+def test_fast_copy_file_zero_copy_file_range_falls_back(tmp_path, monkeypatch):
+    """copy_file_range returning 0 for a non-empty file must not yield an empty copy."""
+    from agent_bridge import utils
+
+    monkeypatch.setattr(utils.os, "copy_file_range", lambda *args: 0, raising=False)
+    src = tmp_path / "src.json"
+    src.write_text('{"mcpServers": {}}')
+    dest = tmp_path / "dest.json"
+
+    utils.fast_copy_file(src, dest)
+
+    assert dest.read_text() == '{"mcpServers": {}}'
+
+
+def test_dir_children(tmp_path):
+    """dir_children lists entry names and tolerates missing paths."""
+    (tmp_path / ".agent").mkdir()
+    (tmp_path / "file.txt").write_text("x")
+
+    assert dir_children(tmp_path) == {".agent", "file.txt"}
+    assert dir_children(tmp_path / "missing") == frozenset()
+    assert dir_children(tmp_path / "file.txt") == frozenset()
+
+
+def test_resolve_source_root_accepts_path(tmp_project):
+    """Path arguments work without str() coercion, for the root or the .agent dir."""
+    from agent_bridge.utils import resolve_source_root
+
+    assert resolve_source_root(tmp_project) == tmp_project
+    assert resolve_source_root(tmp_project / ".agent") == tmp_project
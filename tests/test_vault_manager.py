@@ -0,0 +1,94 @@
+"""Tests for VaultManager config loading."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from agent_bridge.utils import master_agent_dir_status
+from agent_bridge.vault import manager
+
+
+@pytest.fixture(autouse=True)
+def patch_config_paths(tmp_path, monkeypatch):
+    """Patch vaults.json location to tmp_path for isolated tests."""
+    monkeypatch.setattr(manager, "VAULTS_CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(manager, "VAULTS_CONFIG_FILE", tmp_path / "vaults.json")
+    monkeypatch.setattr(manager, "_CONFIG_CACHE", {})
+    return tmp_path
+
+
+def test_config_cache_reflects_add_and_external_edit(tmp_path):
+    """add() updates cache; external edit (new mtime/size) re-parses."""
+    vm = manager.VaultManager()
+    vm.add("team", "/tmp/team-vault")
+
+    assert manager.VaultManager().get("team") is not None
+
+    (tmp_path / "vaults.json").write_text(json.dumps({"vaults": [{"name": "other", "url": "/tmp/other"}]}))
+    vm2 = manager.VaultManager()
+    assert vm2.get("team") is None
+    assert vm2.get("other") is not None
+
+
+def test_cached_vaults_are_independent_copies():
+    """Mutating one manager's Vault does not leak to the next."""
+    vm = manager.VaultManager()
+    vm.add("team", "/tmp/team-vault")
+    manager.VaultManager().get("team").enabled = False
+
+    assert manager.VaultManager().get("team").enabled is True
+
+
+def test_sorted_vaults_cache_invalidated_on_add_remove():
+    """vaults/enabled_vaults reflect add() and remove() despite caching."""
+    vm = manager.VaultManager()
+    before = [v.name for v in vm.vaults]
+    vm.add("first", "/tmp/first", priority=1)
+
+    assert vm.vaults[0].name == "first"
+    assert vm.enabled_vaults[0].name == "first"
+
+    vm.remove("first")
+    assert [v.name for v in vm.vaults] == before
+
+
+def test_vault_to_dict_matches_asdict():
+    """to_dict() stays in sync with the dataclass fields."""
+    from dataclasses import asdict
+
+    vault = manager.Vault(name="team", url="/tmp/team", description="d", priority=5)
+    assert vault.to_dict() == asdict(vault)
+
+
+def test_vault_resolved_local_is_cached():
+    """resolved_local resolves once per instance and stays out of to_dict()."""
+    vault = manager.Vault(name="team", url="/tmp/team")
+    resolved = vault.resolved_local
+
+    assert resolved == Path("/tmp/team").resolve()
+    assert vault.resolved_local is resolved
+    assert "resolved_local" not in vault.to_dict()
+
+
+def test_sync_add_remove_clear_master_agent_dir_status(monkeypatch):
+    """Vault changes drop the memoized master .agent status so callers re-check it."""
+
+    class _OkSource:
+        def sync(self, cache_dir, verbose=True):
+            return {"status": "ok"}
+
+    monkeypatch.setattr(manager.Vault, "get_source", lambda self: _OkSource())
+    vm = manager.VaultManager()
+
+    master_agent_dir_status()
+    vm.add("team", "/tmp/team-vault")
+    assert master_agent_dir_status.cache_info().currsize == 0
+
+    master_agent_dir_status()
+    vm.sync("team", verbose=False)
+    assert master_agent_dir_status.cache_info().currsize == 0
+
+    master_agent_dir_status()
+    vm.remove("team")
+    assert master_agent_dir_status.cache_info().currsize == 0
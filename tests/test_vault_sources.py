@@ -0,0 +1,129 @@
+"""Tests for vault source strategies."""
+
+import os
+import subprocess
+
+from agent_bridge.vault import sources
+from agent_bridge.vault.sources import GitSource, VaultSource
+
+_URL = "https://example.com/team/vault.git"
+
+
+class _FakeGit:
+    """Stand-in for subprocess.run: records each git argv and answers by subcommand."""
+
+    def __init__(self, **replies):
+        # replies: subcommand name (e.g. "rev-parse") -> (returncode, stdout) or a list of them
+        self.replies = replies
+        self.calls = []
+
+    def __call__(self, argv, **kwargs):
+        self.calls.append(argv)
+        subcommand = argv[3] if argv[1] == "-C" else argv[1]
+        reply = self.replies.get(subcommand.replace("-", "_"), (0, b""))
+        if isinstance(reply, list):
+            reply = reply.pop(0)
+        returncode, stdout = reply
+        return subprocess.CompletedProcess(argv, returncode, stdout=stdout, stderr=b"")
+
+
+def test_count_content_recounts_after_directory_changes(tmp_path):
+    """Cached counts are refreshed when agents/ or skills/ gain entries."""
+    agent_dir = tmp_path / ".agent"
+    (agent_dir / "agents").mkdir(parents=True)
+    (agent_dir / "agents" / "a.md").write_text("a")
+
+    assert VaultSource._count_content(agent_dir) == {"agents": 1, "skills": 0}
+
+    (agent_dir / "agents" / "b.md").write_text("b")
+    (agent_dir / "skills" / "s").mkdir(parents=True)
+    # Force a distinct mtime even on coarse-resolution filesystems
+    os.utime(agent_dir / "agents", ns=(0, 1))
+
+    assert VaultSource._count_content(agent_dir) == {"agents": 2, "skills": 1}
+
+
+def test_git_sync_clones_shallow_single_branch_when_cache_missing(tmp_path, monkeypatch):
+    """A missing cache dir is cloned shallow, single-branch, tagless and blobless."""
+    cache_dir = tmp_path / "cache" / "vault"
+    fake = _FakeGit(rev_parse=(128, b""))
+    monkeypatch.setattr(sources.subprocess, "run", fake)
+
+    stats = GitSource(_URL).sync(cache_dir, verbose=False)
+
+    assert stats["status"] == "ok"
+    assert fake.calls == [
+        ["git", "-C", str(cache_dir), "rev-parse", "--show-toplevel"],
+        [
+            "git",
+            "clone",
+            "--depth",
+            "1",
+            "--single-branch",
+            "--no-tags",
+            "--filter=blob:none",
+            _URL,
+            str(cache_dir),
+        ],
+    ]
+
+
+def test_git_sync_skips_fetch_when_up_to_date(tmp_path, monkeypatch):
+    """Local HEAD matching origin HEAD means no fetch or reset."""
+    cache_dir = tmp_path / "vault"
+    cache_dir.mkdir()
+    fake = _FakeGit(
+        rev_parse=[(0, str(cache_dir).encode() + b"\n"), (0, b"abc123\n")],
+        ls_remote=(0, b"abc123\tHEAD\n"),
+    )
+    monkeypatch.setattr(sources.subprocess, "run", fake)
+
+    assert GitSource(_URL).sync(cache_dir, verbose=False)["status"] == "ok"
+    assert fake.calls == [
+        ["git", "-C", str(cache_dir), "rev-parse", "--show-toplevel"],
+        ["git", "-C", str(cache_dir), "ls-remote", "origin", "HEAD"],
+        ["git", "-C", str(cache_dir), "rev-parse", "HEAD"],
+    ]
+
+
+def test_git_sync_fetches_and_resets_when_behind(tmp_path, monkeypatch):
+    """A remote HEAD ahead of the cache triggers a shallow fetch and hard reset."""
+    cache_dir = tmp_path / "vault"
+    cache_dir.mkdir()
+    fake = _FakeGit(
+        rev_parse=[(0, str(cache_dir).encode() + b"\n"), (0, b"old000\n")],
+        ls_remote=(0, b"new111\tHEAD\n"),
+    )
+    monkeypatch.setattr(sources.subprocess, "run", fake)
+
+    assert GitSource(_URL).sync(cache_dir, verbose=False)["status"] == "ok"
+    assert fake.calls[3:] == [
+        ["git", "-C", str(cache_dir), "fetch", "--depth=1", "--no-tags", "--filter=blob:none", "origin"],
+        ["git", "-C", str(cache_dir), "reset", "--hard", "FETCH_HEAD"],
+    ]
+
+
+def test_git_sync_reclones_when_cache_dir_is_not_its_own_repo(tmp_path, monkeypatch):
+    """A cache dir inside a parent repo (toplevel elsewhere) is wiped and re-cloned."""
+    cache_dir = tmp_path / "vault"
+    cache_dir.mkdir()
+    (cache_dir / "stale.md").write_text("stale")
+    fake = _FakeGit(rev_parse=(0, str(tmp_path).encode() + b"\n"))
+    monkeypatch.setattr(sources.subprocess, "run", fake)
+
+    assert GitSource(_URL).sync(cache_dir, verbose=False)["status"] == "ok"
+    assert not cache_dir.exists()
+    assert fake.calls == [
+        ["git", "-C", str(cache_dir), "rev-parse", "--show-toplevel"],
+        [
+            "git",
+            "clone",
+            "--depth",
+            "1",
+            "--single-branch",
+            "--no-tags",
+            "--filter=blob:none",
+            _URL,
+            str(cache_dir),
+        ],
+    ]
@@ -0,0 +1,86 @@
+"""Tests for Windsurf converter."""
+
+import pytest
+
+from agent_bridge.converters._windsurf_impl import (
+    _write_output,
+    convert_agent_to_windsurf_rule,
+    convert_skill_to_windsurf_rule,
+    convert_workflow_to_windsurf,
+)
+
+_AGENT_RULE_HEADER = (
+    "# My Agent\n\n**Activation:** Model Decision\n**Description:** Specialized agent for my agent tasks\n\n---\n"
+)
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected_body"),
+    [
+        (b"\n\nPlain agent body\n\n", "Plain agent body\n"),
+        (b"---\ndescription: x\n---\nBody after frontmatter\n", "Body after frontmatter\n"),
+        ("Body ends with NBSP\u00a0\n".encode(), "Body ends with NBSP\n"),
+        ("Unicode body: ti\u1ebfng vi\u1ec7t\n".encode(), "Unicode body: ti\u1ebfng vi\u1ec7t\n"),
+        (b"\x1cSeparator-prefixed\n", "Separator-prefixed\n"),
+        (b"Windows\r\nline endings\r\n", "Windows\nline endings\n"),
+        (b"---\r\nnot: frontmatter\r\n---\r\nBody\r\n", "Body\n"),
+    ],
+)
+def test_agent_rule_bytes_fast_path_matches_text_path(tmp_path, raw, expected_body):
+    """Bytes fast path produces the same output as decode/strip/encode."""
+    source = tmp_path / "my-agent.md"
+    source.write_bytes(raw)
+    dest = tmp_path / "out" / "my-agent.md"
+
+    assert convert_agent_to_windsurf_rule(source, dest) is True
+
+    assert dest.read_bytes() == (_AGENT_RULE_HEADER + expected_body).encode("utf-8")
+
+
+def test_write_output_str_and_bytes_write_identical_bytes(tmp_path):
+    """The str branch must not translate newlines, so both branches produce the same file."""
+    text = _AGENT_RULE_HEADER + "Body\nwith lines\n"
+    _write_output(str(tmp_path / "str" / "rule.md"), text)
+    _write_output(str(tmp_path / "bytes" / "rule.md"), text.encode("utf-8"))
+
+    assert (tmp_path / "str" / "rule.md").read_bytes() == (tmp_path / "bytes" / "rule.md").read_bytes()
+
+
+def test_agent_rule_oversized_source_is_truncated(tmp_path):
+    """Huge sources are read in a bounded window and still truncated to the rule limit."""
+    source = tmp_path / "big.md"
+    source.write_text("x" * 1_000_000, encoding="utf-8")
+    dest = tmp_path / "out" / "big.md"
+
+    assert convert_agent_to_windsurf_rule(source, dest) is True
+
+    output = dest.read_text(encoding="utf-8")
+    assert len(output) == 12000
+    assert output.endswith("(truncated to fit Windsurf rule limit)\n")
+
+
+@pytest.mark.parametrize("blank_header", ["## \n", "##  \t\n"])
+def test_workflow_blank_header_does_not_swallow_next_step(tmp_path, blank_header):
+    """An empty "##" line right before a numbered step must not consume that step."""
+    source = tmp_path / "deploy.md"
+    source.write_text(f"# Deploy\n\n{blank_header}1. Do X\n", encoding="utf-8")
+    dest = tmp_path / "out" / "deploy.md"
+
+    assert convert_workflow_to_windsurf(source, dest) is True
+
+    output = dest.read_text(encoding="utf-8")
+    assert "## Steps\n\n1. Do X\n" in output
+
+
+def test_skill_merges_hidden_markdown_files(tmp_path):
+    """Extra *.md files are merged like Path.glob("*.md") lists them, dotfiles included."""
+    skill_dir = tmp_path / "my-skill"
+    skill_dir.mkdir()
+    (skill_dir / "SKILL.md").write_text("# My Skill\n\nMain.\n", encoding="utf-8")
+    (skill_dir / ".notes.md").write_text("Hidden notes.\n", encoding="utf-8")
+    dest = tmp_path / "out" / "my-skill.md"
+
+    assert convert_skill_to_windsurf_rule(skill_dir, dest) is True
+
+    output = dest.read_text(encoding="utf-8")
+    assert output.endswith("Main.\n\n\n---\n\nHidden notes.\n")